@@ -106,6 +106,7 @@ def register():
     from .tools import vsm_tools
 
     from .utils import utils_operators
+    from .utils import utils_vse
 
     from .opengl import sequencer_draw
 
@@ -159,7 +160,7 @@ def register():
     markers_nav_bar.register()
 
     utils_operators.register()
-    #   utils_vse.register()
+    utils_vse.register()
 
     # operators
     prefs.register()
@@ -211,6 +212,7 @@ def unregister():
     from .tools import vsm_tools
 
     from .utils import utils_operators
+    from .utils import utils_vse
 
     from .opengl import sequencer_draw
 
@@ -250,7 +252,7 @@ def unregister():
     addon_prefs.unregister()
 
     otio.unregister()
-    #  utils_vse.unregister()
+    utils_vse.unregister()
 
     # for cls in reversed(classes):
     #     bpy.utils.unregister_class(cls)
@@ -3,28 +3,121 @@ from typing import Union
 import bpy
 from .utils import get_region_at_xy
 from .widgets import BGLWidget, BGLRegion
-from .types import BGLTransform
+from .geometry import BGLDrawBatch
+from .types import BGLTransform, BGLCoord, BGLViewToRegion
 
 
 class BGLCanvas:
-    def __init__(self, transform=None, crop_left=0, crop_bottom=0, crop_right=0, crop_top=0):
+    """
+    batched: if True the flat colored geometries of the widgets are drawn in a single draw call, and the texts
+    are drawn over them in a second pass. Textures are still drawn one by one, under the batched geometries.
+
+    The events are given only to the widgets which bound overlaps the row of the mouse, found with an index of the
+    widgets by rows of hit_test_row_height pixels of the region. The index is rebuilt when the view or the list of
+    widgets changes.
+
+    When the transform of the canvas applies the view to the y coordinates, the widgets out of the vertical range
+    of the view (eg: the rows of the channels not displayed) are skipped when drawing and handling the events.
+    """
+
+    hit_test_row_height = 20
+
+    def __init__(self, transform=None, crop_left=0, crop_bottom=0, crop_right=0, crop_top=0, batched=False):
         BGLWidget.__init__(self)
         self._widgets: list[BGLWidget] = list()
         self._region = BGLRegion(crop_left, crop_bottom, crop_right, crop_top)
         self._region.transform = BGLTransform() if transform is None else transform
         self._last_widget_handled = None
+        self._draw_batch = BGLDrawBatch() if batched else None
+
+        self._hit_test_key = None
+        self._hit_test_rows = dict()
+        self._hovered_widget_indices = set()
 
     def addWidget(self, widget: BGLWidget):
         self._widgets.append(widget)
+        self._hit_test_key = None
 
     def clear(self):
         self._widgets.clear()
+        self._hit_test_key = None
+        self._hovered_widget_indices = set()
+        self._last_widget_handled = None
+
+    def get_visible_view_range(self):
+        """
+        Return the tuple (min y, max y), in view space, of the part of the region displayed by the canvas,
+        None if the transform of the canvas doesn't apply the view to the y coordinates.
+        """
+        transform = self._region.transform
+        if not isinstance(transform, BGLViewToRegion) or not transform.apply_to_y:
+            return None
+        region_bound = self._region.bound
+        view2d = self._region.bl_region.view2d
+        return (
+            view2d.region_to_view(region_bound.min.x, region_bound.min.y)[1],
+            view2d.region_to_view(region_bound.min.x, region_bound.max.y)[1],
+        )
+
+    def _get_hit_test_key(self):
+        bl_region = self._region.bl_region
+        return (
+            len(self._widgets),
+            bl_region.width,
+            bl_region.height,
+            tuple(bl_region.view2d.region_to_view(0, 0)),
+            tuple(bl_region.view2d.region_to_view(bl_region.width, bl_region.height)),
+        )
+
+    def _build_hit_test_index(self):
+        """
+        Index the widgets overlapping the region by rows of the region, the indices of the widgets in a row are
+        sorted.
+        """
+        rows = dict()
+        region_bound = self._region.bound
+        view_range = self.get_visible_view_range()
+        for ind, wdgt in enumerate(self._widgets):
+            if view_range is not None and not wdgt.is_in_view_range(*view_range):
+                continue
+            bound = wdgt.get_bound(self._region)
+            if not region_bound.do_overlap(bound):
+                continue
+            first_row = int(bound.min.y // self.hit_test_row_height)
+            last_row = int(bound.max.y // self.hit_test_row_height)
+            for row in range(first_row, last_row + 1):
+                rows.setdefault(row, []).append(ind)
+        self._hit_test_rows = rows
+
+    def get_widgets_at_y(self, y):
+        """
+        Return the indices of the widgets which bound may contain the specified region y coordinate.
+        """
+        key = self._get_hit_test_key()
+        if key != self._hit_test_key:
+            self._build_hit_test_index()
+            self._hit_test_key = key
+        return self._hit_test_rows.get(int(y // self.hit_test_row_height), ())
 
     def draw(self, region: bpy.types.Region):
         self._region.bl_region = region
-        for wdgt in self._widgets:
-            if wdgt.visible:
-                wdgt._draw(self._region)
+        self._region.draw_batch = self._draw_batch
+        view_range = self.get_visible_view_range()
+        try:
+            for wdgt in self._widgets:
+                if wdgt.visible and (view_range is None or wdgt.is_in_view_range(*view_range)):
+                    wdgt._draw(self._region)
+        finally:
+            self._region.draw_batch = None
+
+        if self._draw_batch is not None:
+            self._draw_batch.flush(self._region)
+
+    def get_state_fingerprint(self):
+        """
+        Return the indices of the widgets hovered by the mouse, used to know if the canvas has to be redrawn.
+        """
+        return tuple(i for i, wdgt in enumerate(self._widgets) if wdgt.is_hovered())
 
     def handle_event(self, region: bpy.types.Region, event: bpy.types.Event) -> bool:
         self._region.bl_region = region
@@ -33,25 +126,47 @@ class BGLCanvas:
             if self._last_widget_handled.handle_event(self._region, event):
                 return True
 
-        for wdgt in reversed(self._widgets):  # LAst defined widget have the priority
+        mouse_pos = self._region.mouse_to_region(BGLCoord(event.mouse_x, event.mouse_y))
+        candidates = set(self.get_widgets_at_y(mouse_pos.y))
+        # the hovered widgets get the event too so that they can update their state when the mouse leaves them
+        candidates.update(self._hovered_widget_indices)
+
+        handled = False
+        for ind in sorted(candidates, reverse=True):  # LAst defined widget have the priority
+            wdgt = self._widgets[ind]
             if wdgt is self._last_widget_handled:  # Handled first
                 continue
             if wdgt.visible:
                 if wdgt._handle_event(self._region, event):
                     self._last_widget_handled = wdgt
-                    return True
+                    handled = True
+                    break
 
-        return False
+        self._hovered_widget_indices = {ind for ind in candidates if self._widgets[ind].is_hovered()}
+        return handled
 
 
 class BGL_UIOperatorBase(bpy.types.Operator):
+    """
+    The areas of the type of space_type() are redrawn only when the state fingerprint changes, see
+    get_state_fingerprint(). The interval of the timer doubles, up to timer_max_interval, while nothing changes.
+    """
+
     bl_idname = "bgl.operator"
     bl_label = "BGL UI Operator"
     bl_options = {"REGISTER", "INTERNAL"}
 
+    timer_min_interval = 0.1
+    timer_max_interval = 1.0
+    # number of timer events without change before the timer interval is increased
+    timer_idle_steps = 5
+
     def __init__(self):
         self._draw_handle = None
         self._timer = None
+        self._timer_interval = self.timer_min_interval
+        self._idle_timer_events = 0
+        self._last_fingerprint = None
         self.context = None
 
         self._canvas = list()  # type: list[BGLCanvas]
@@ -78,22 +193,70 @@ class BGL_UIOperatorBase(bpy.types.Operator):
     def should_cancel(self) -> bool:
         raise NotImplementedError()
 
-    def modal(self, context, event):
-        if self.should_rebuild_ui():
-            self._canvas.clear()
-            self.build_ui()
-
-        if not self.should_handle_event():
-            return {"PASS_THROUGH"}
-
-        for area in context.screen.areas:
-            area.tag_redraw()
-
+    def get_ui_state(self) -> tuple:
+        """
+        Return the state of the data displayed by the ui, to override.
+        The areas are redrawn when this state changes.
+        """
+        return ()
+
+    def _get_areas(self, context):
+        return [area for area in context.screen.areas if isinstance(area.spaces.active, self.space_type())]
+
+    def get_state_fingerprint(self, context) -> tuple:
+        """
+        Return the state of the views of the areas, of the widgets hovered by the mouse and of the displayed data.
+        """
+        views = list()
+        for area in self._get_areas(context):
+            for region in area.regions:
+                if "WINDOW" == region.type:
+                    views.append(
+                        (
+                            region.width,
+                            region.height,
+                            tuple(region.view2d.region_to_view(0, 0)),
+                            tuple(region.view2d.region_to_view(region.width, region.height)),
+                        )
+                    )
+
+        return (tuple(views), tuple(canva.get_state_fingerprint() for canva in self._canvas), self.get_ui_state())
+
+    def _set_timer_interval(self, context, interval):
+        if interval != self._timer_interval:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = context.window_manager.event_timer_add(interval, window=context.window)
+            self._timer_interval = interval
+
+    def _update_redraw(self, context, event):
+        """
+        Redraw the areas if the state fingerprint changed, and adapt the timer interval.
+        """
+        fingerprint = self.get_state_fingerprint(context)
+        if fingerprint != self._last_fingerprint:
+            self._last_fingerprint = fingerprint
+            for area in self._get_areas(context):
+                area.tag_redraw()
+            self._idle_timer_events = 0
+            self._set_timer_interval(context, self.timer_min_interval)
+
+        elif "TIMER" == event.type:
+            self._idle_timer_events += 1
+            if self.timer_idle_steps <= self._idle_timer_events:
+                self._idle_timer_events = 0
+                self._set_timer_interval(context, min(self._timer_interval * 2, self.timer_max_interval))
+
+        else:
+            # user interaction
+            self._idle_timer_events = 0
+            self._set_timer_interval(context, self.timer_min_interval)
+
+    def _handle_event(self, context, event) -> bool:
         region, _ = get_region_at_xy(context, event.mouse_x, event.mouse_y)
         if region is not None:
             if self._last_handled_canvas is not None:
                 if self._last_handled_canvas.handle_event(region, event):
-                    return {"RUNNING_MODAL"}
+                    return True
 
             for canva in reversed(
                 self._canvas
@@ -102,7 +265,23 @@ class BGL_UIOperatorBase(bpy.types.Operator):
                     continue
                 if canva.handle_event(region, event):
                     self._last_handled_canvas = canva
-                    return {"RUNNING_MODAL"}
+                    return True
+
+        return False
+
+    def modal(self, context, event):
+        if self.should_rebuild_ui():
+            self._canvas.clear()
+            self.build_ui()
+            self._last_fingerprint = None
+
+        if not self.should_handle_event():
+            return {"PASS_THROUGH"}
+
+        handled = self._handle_event(context, event)
+        self._update_redraw(context, event)
+        if handled:
+            return {"RUNNING_MODAL"}
 
         if self.should_cancel():
             context.window_manager.event_timer_remove(self._timer)
@@ -125,7 +304,8 @@ class BGL_UIOperatorBase(bpy.types.Operator):
         self.context = context
 
         self._draw_handle = self.space_type().draw_handler_add(self.draw, (context,), "WINDOW", "POST_PIXEL")
-        self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
+        self._timer_interval = self.timer_min_interval
+        self._timer = context.window_manager.event_timer_add(self._timer_interval, window=context.window)
         context.window_manager.modal_handler_add(self)
         self.build_ui()
 
@@ -7,8 +7,12 @@ Maybe geometry should not have a defined position. The widgets are responsible f
 
 Move Shader draw calls in here part in there
 
-Todo:
-    - allow caching of batch so we don't recreate them at each draw call. Maybe via setting a callback to a BGLProp.
+Batches are cached by the geometries and rebuilt only when the key of their geometry changes, see
+BGLGeometry.get_cached_batch(). The key of the rectangles is their bound in region space, so a batch is rebuilt
+when the widget moves or when the view is scrolled or zoomed.
+
+In a batched canvas the geometries of flat color add their triangles to the BGLDrawBatch of the region instead of
+drawing them, and the texts are queued. The canvas then draws all the triangles in one call and the texts after them.
 """
 
 from typing import Callable, Union
@@ -19,18 +23,92 @@ import bpy, blf, bgl
 from mathutils import Vector
 
 from .types import BGLColor, BGLBound, BGLRegion, BGLCoord, BGLPropValue, BGLProp, BGLImageManager
-from .shaders import BGLImageShader, BGLUniformShader
+from .shaders import BGLImageShader, BGLUniformShader, BGLFlatColorShader
 
 from videotracks.utils import utils
 
 
+class BGLDrawBatch:
+    """
+    Flat colored triangles and texts collected while the widgets of a canvas are drawn.
+    The triangles are drawn in the order they are added, in a single draw call, then the texts are drawn.
+    """
+
+    def __init__(self):
+        self._positions = list()
+        self._colors = list()
+        self._indices = list()
+        self._texts = list()
+
+        self._batch_key = None
+        self._batch = None
+
+    def add_triangles(self, points, indices, color: BGLColor):
+        """
+        color is the color that would be given to BGLUniformShader.set_color().
+        """
+        offset = len(self._positions)
+        vertex_color = BGLFlatColorShader.convert_color(color)
+        self._positions.extend(points)
+        self._colors.extend([vertex_color] * len(points))
+        self._indices.extend(tuple(offset + ind for ind in triangle) for triangle in indices)
+
+    def add_rect(self, bound: BGLBound, color: BGLColor):
+        self.add_triangles(
+            [
+                (bound.min.x, bound.min.y),
+                (bound.max.x, bound.min.y),
+                (bound.max.x, bound.max.y),
+                (bound.min.x, bound.max.y),
+            ],
+            ((0, 1, 3), (1, 2, 3)),
+            color,
+        )
+
+    def add_text(self, text: "BGLText", rotation=0):
+        self._texts.append((text, rotation))
+
+    def flush(self, region: BGLRegion):
+        if self._positions:
+            # the batch is kept while the drawn geometries don't change
+            key = (self._positions, self._colors, self._indices)
+            if self._batch is None or key != self._batch_key:
+                self._batch = BGLFlatColorShader.create_batch(
+                    "TRIS", {"pos": self._positions, "color": self._colors}, indices=self._indices
+                )
+                self._batch_key = key
+
+            with BGLFlatColorShader() as shader:
+                shader.draw_batch(self._batch)
+
+        for text, rotation in self._texts:
+            text.draw_now(region, rotation)
+
+        self._positions = list()
+        self._colors = list()
+        self._indices = list()
+        self._texts = list()
+
+
 class BGLGeometry:
     position = BGLProp(BGLCoord())
 
     def __init__(self, **prop_values):
+        self._batch_key = None
+        self._batch = None
         for k, v in prop_values.items():
             setattr(self, k, v)
 
+    def get_cached_batch(self, key, create_batch: Callable):
+        """
+        Return the batch of the geometry, created by calling create_batch() if key is different from the key
+        of the cached batch.
+        """
+        if self._batch is None or key != self._batch_key:
+            self._batch = create_batch()
+            self._batch_key = key
+        return self._batch
+
     def get_bound(self, region: BGLRegion = None) -> BGLBound:
         return BGLBound()
 
@@ -65,19 +143,30 @@ class BGLRect(BGLGeometry):
 
         return False
 
+    @staticmethod
+    def get_bound_key(bound: BGLBound):
+        return (bound.min.x, bound.min.y, bound.max.x, bound.max.y)
+
     def draw(self, region: BGLRegion):
         bound = self.get_bound(region)
-        batch = BGLUniformShader.create_batch(
-            "TRIS",
-            {
-                "pos": [
-                    Vector(list(bound.min)),
-                    Vector([bound.max.x, bound.min.y]),
-                    Vector(list(bound.max)),
-                    Vector([bound.min.x, bound.max.y]),
-                ]
-            },
-            indices=[(0, 1, 3), (1, 2, 3)],
+        if region.draw_batch is not None:
+            region.draw_batch.add_rect(bound, self.color.to_sRGB())
+            return
+
+        batch = self.get_cached_batch(
+            self.get_bound_key(bound),
+            lambda: BGLUniformShader.create_batch(
+                "TRIS",
+                {
+                    "pos": [
+                        Vector(list(bound.min)),
+                        Vector([bound.max.x, bound.min.y]),
+                        Vector(list(bound.max)),
+                        Vector([bound.min.x, bound.max.y]),
+                    ]
+                },
+                indices=[(0, 1, 3), (1, 2, 3)],
+            ),
         )
 
         with BGLUniformShader() as shader:
@@ -91,17 +180,32 @@ class BGLRectLine(BGLRect):
 
     def draw(self, region: BGLRegion):
         bound = self.get_bound(region)
-        batch = BGLUniformShader.create_batch(
-            "LINES",
-            {
-                "pos": [
-                    Vector(list(bound.min)),
-                    Vector([bound.max.x, bound.min.y]),
-                    Vector(list(bound.max)),
-                    Vector([bound.min.x, bound.max.y]),
-                ]
-            },
-            indices=[(0, 1), (1, 2), (2, 3), (3, 0)],
+        if region.draw_batch is not None:
+            # the lines are drawn as rectangles of the width of the line, centered on the sides of the bound
+            color = self.color.to_sRGB()
+            half_width = self.line_width * 0.5
+            lo = BGLCoord(bound.min.x - half_width, bound.min.y - half_width)
+            hi = BGLCoord(bound.max.x + half_width, bound.max.y + half_width)
+            region.draw_batch.add_rect(BGLBound(lo, BGLCoord(hi.x, lo.y + self.line_width)), color)
+            region.draw_batch.add_rect(BGLBound(BGLCoord(lo.x, hi.y - self.line_width), hi), color)
+            region.draw_batch.add_rect(BGLBound(lo, BGLCoord(lo.x + self.line_width, hi.y)), color)
+            region.draw_batch.add_rect(BGLBound(BGLCoord(hi.x - self.line_width, lo.y), hi), color)
+            return
+
+        batch = self.get_cached_batch(
+            self.get_bound_key(bound),
+            lambda: BGLUniformShader.create_batch(
+                "LINES",
+                {
+                    "pos": [
+                        Vector(list(bound.min)),
+                        Vector([bound.max.x, bound.min.y]),
+                        Vector(list(bound.max)),
+                        Vector([bound.min.x, bound.max.y]),
+                    ]
+                },
+                indices=[(0, 1), (1, 2), (2, 3), (3, 0)],
+            ),
         )
 
         with BGLUniformShader() as shader:
@@ -134,7 +238,7 @@ class BGLCircle(BGLGeometry):
 
         return False
 
-    def draw(self, region: BGLRegion):
+    def _get_triangles(self):
         points = list()
         indices = list()
         num_pts = self.division
@@ -151,7 +255,20 @@ class BGLCircle(BGLGeometry):
             indices.append((0, i + 1, i + 2))
         indices.append((0, num_pts, 1))  # Last Face
 
-        batch = BGLUniformShader.create_batch("TRIS", {"pos": points}, indices=indices)
+        return points, indices
+
+    def _create_batch(self):
+        points, indices = self._get_triangles()
+        return BGLUniformShader.create_batch("TRIS", {"pos": points}, indices=indices)
+
+    def draw(self, region: BGLRegion):
+        if region.draw_batch is not None:
+            points, indices = self._get_triangles()
+            region.draw_batch.add_triangles([tuple(p) for p in points], indices, self.color)
+            return
+
+        position = self.position
+        batch = self.get_cached_batch((position.x, position.y, self.radius, self.division), self._create_batch)
         with BGLUniformShader() as shader:
             shader.set_color(self.color)
             shader.draw_batch(batch)
@@ -193,16 +310,25 @@ class BGLText(BGLGeometry):
         return False
 
     def drawAdv(self, region, rotation=0):
+        if region.draw_batch is not None:
+            region.draw_batch.add_text(self, rotation)
+        else:
+            self.draw_now(region, rotation)
+
+    def draw(self, region):
+        self.drawAdv(region)
+
+    def draw_now(self, region, rotation=0):
         fontid = 0
         # https://blenderartists.org/t/blf-clipping-aspect-rotation-shadow-blur/544985/4
         if 0 != rotation:
             blf.rotation(fontid, rotation)
             blf.enable(fontid, blf.ROTATION)
-        self.draw(region)
+        self._draw_text(region)
         if 0 != rotation:
             blf.disable(fontid, blf.ROTATION)
 
-    def draw(self, region):
+    def _draw_text(self, region):
         fontid = 0
         blf.size(fontid, self.size, 72)
         bound = self.get_bound(region)
@@ -228,18 +354,21 @@ class BGLTexture(BGLRect):
         if self.image is None:
             return
         bound = self.get_bound(region)
-        batch = BGLImageShader.create_batch(
-            "TRIS",
-            {
-                "pos": [
-                    Vector(list(bound.min)),
-                    Vector([bound.max.x, bound.min.y]),
-                    Vector(list(bound.max)),
-                    Vector([bound.min.x, bound.max.y]),
-                ],
-                "texCoord": ((0, 0), (1, 0), (1, 1), (0, 1)),
-            },
-            indices=[(0, 1, 3), (1, 2, 3)],
+        batch = self.get_cached_batch(
+            self.get_bound_key(bound),
+            lambda: BGLImageShader.create_batch(
+                "TRIS",
+                {
+                    "pos": [
+                        Vector(list(bound.min)),
+                        Vector([bound.max.x, bound.min.y]),
+                        Vector(list(bound.max)),
+                        Vector([bound.min.x, bound.max.y]),
+                    ],
+                    "texCoord": ((0, 0), (1, 0), (1, 1), (0, 1)),
+                },
+                indices=[(0, 1, 3), (1, 2, 3)],
+            ),
         )
 
         with BGLImageShader() as shader:
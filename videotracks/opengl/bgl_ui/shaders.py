@@ -50,6 +50,20 @@ class BGLUniformShader(BGLShader):
         )  # We'll do conversion here because fragment shader is a bit strange.
 
 
+class BGLFlatColorShader(BGLShader):
+    """
+    Shader with a color per vertex, used to draw geometries of different colors in a single batch.
+    The colors have to be converted in the vertex data the same way BGLUniformShader.set_color() does.
+    """
+
+    vertex_shader = gpu.shader.code_from_builtin("2D_FLAT_COLOR")["vertex_shader"]
+    fragment_shader = gpu.shader.code_from_builtin("2D_FLAT_COLOR")["fragment_shader"]
+
+    @staticmethod
+    def convert_color(color: BGLColor):
+        return tuple(color ** 0.454545)
+
+
 class BGLImageShader(BGLShader):
     vertex_shader = gpu.shader.code_from_builtin("2D_IMAGE")["vertex_shader"]
     fragment_shader = """
@@ -351,6 +351,8 @@ class BGLRegion:
         self._crops = (crop_left, crop_bottom, crop_right, crop_top)
         self.bl_region: bpy.types.Region = None
         self.transform = BGLTransform()
+        # set by a batched canvas while its widgets are drawn, see geometry.BGLDrawBatch
+        self.draw_batch = None
 
     @property
     def bound(self) -> BGLBound:
@@ -32,6 +32,21 @@ class BGLWidget:
     def get_bound(self, region: BGLRegion):
         return BGLBound()
 
+    def get_view_bound(self) -> Union[BGLBound, None]:
+        """
+        Return the bound of the widget before the transformation of the region, None if it is not known.
+        """
+        return None
+
+    def is_in_view_range(self, view_min_y, view_max_y) -> bool:
+        """
+        Return False if the widget is known to be out of the specified vertical range, in view space.
+        """
+        bound = self.get_view_bound()
+        if bound is None:
+            return True
+        return view_min_y <= bound.max.y and bound.min.y <= view_max_y
+
     def _draw(self, region: BGLRegion):
         if region.bound.do_overlap(self.get_bound(region)):
             self.draw(region)
@@ -48,6 +63,12 @@ class BGLWidget:
     def handle_event(self, region: BGLRegion, event: bpy.types.Event) -> bool:
         return False
 
+    def is_hovered(self) -> bool:
+        """
+        Return True if the widget is displayed differently because of the mouse.
+        """
+        return False
+
     def debug_print(self, *args, **kwargs):
         if self.debug is True:
             print(*args, **kwargs)
@@ -94,6 +115,9 @@ class BGLLabel(BGLWidget):
     def get_bound(self, region):
         return self._geometry.get_bound(region)
 
+    def get_view_bound(self):
+        return self._geometry.get_bound()
+
     def draw(self, region):
         self._geometry.draw(region)
         self._text_geometry.drawAdv(region, rotation=self.rotation)
@@ -168,6 +192,12 @@ class BGLButton(BGLWidget):
     def get_bound(self, region):
         return self._geometry.get_bound(region)
 
+    def get_view_bound(self):
+        return self._geometry.get_bound()
+
+    def is_hovered(self) -> bool:
+        return self.is_highlighted
+
     def handle_event(self, region, event: bpy.types.Event) -> bool:
         mouse_pos = region.mouse_to_region(BGLCoord(event.mouse_x, event.mouse_y))
         if event.type == "LEFTMOUSE":
@@ -209,6 +239,9 @@ class BGLGeometryStamp(BGLWidget):
     def get_bound(self, region):
         return self.geometry.get_bound(region)
 
+    def get_view_bound(self):
+        return self.geometry.get_bound()
+
     def draw(self, region: BGLRegion):
         self.geometry.draw(region)
 
@@ -258,6 +291,9 @@ class BGLCheckBox(BGLWidget):
     def get_bound(self, region: BGLRegion):
         return self._bg_rect.get_bound(region) + self._text_geo.get_bound(region)
 
+    def is_hovered(self) -> bool:
+        return self._highlighted
+
     def handle_event(self, region, event: bpy.types.Event) -> bool:
         mouse_pos = region.mouse_to_region(BGLCoord(event.mouse_x, event.mouse_y))
         if event.type == "LEFTMOUSE":
@@ -347,6 +383,12 @@ class BGLSlider(BGLWidget):
     def get_bound(self, region):
         return self._back_geo.get_bound(region)
 
+    def get_view_bound(self):
+        return self._back_geo.get_bound()
+
+    def is_hovered(self) -> bool:
+        return self._focused
+
     def draw(self, region: BGLRegion):
         self._front_geo.width = utils.remap(self.value, self.min, self.max, 0, 1) * self._back_geo.width
 
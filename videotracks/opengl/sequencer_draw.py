@@ -184,7 +184,7 @@ class UAS_VideoTracks_TracksOverlay(BGL_UIOperatorBase):
         textColor = BGLColor(0.9, 0.9, 0.9)
         selectedColor = BGLColor(0.99, 0.99, 0.99, 0.2)
 
-        canva = BGLCanvas(BGLViewToRegion(), 0, 11, 11, 22)
+        canva = BGLCanvas(BGLViewToRegion(), 0, 11, 11, 22, batched=True)
         self.add_canva(canva)
         size = 100000
 
@@ -202,7 +202,8 @@ class UAS_VideoTracks_TracksOverlay(BGL_UIOperatorBase):
         canva.addWidget(frame_range_left)
         canva.addWidget(frame_range_right)
 
-        canva = BGLCanvas(BGLViewToRegion(apply_to_x=False), 0, 11, 11, 22)
+        # the headers of all the tracks are drawn in a single call, then their texts
+        canva = BGLCanvas(BGLViewToRegion(apply_to_x=False), 0, 11, 11, 22, batched=True)
         self.add_canva(canva)
 
         # rect.color = lambda prop=props: BGLColor(
@@ -388,6 +389,16 @@ class UAS_VideoTracks_TracksOverlay(BGL_UIOperatorBase):
         else:
             return False
 
+    def get_ui_state(self):
+        scene = bpy.context.scene
+        props = scene.UAS_video_tracks_props
+        return (
+            scene.frame_start,
+            scene.frame_end,
+            props.selected_track_index,
+            tuple((t.name, tuple(t.color), t.enabled, t.opacity) for t in props.tracks),
+        )
+
 
 _classes = (UAS_VideoTracks_TracksOverlay,)
 
@@ -25,6 +25,7 @@ from bpy.props import StringProperty, FloatProperty, IntProperty
 
 from videotracks.config import config
 from videotracks.utils import utils
+from videotracks.utils import utils_vse
 
 
 class UAS_VideoTracks_SelectedToActive(Operator):
@@ -151,95 +152,44 @@ class UAS_VideoTracks_ZoomView(Operator):
         # bpy.ops.sequencer.view_selected()
         # bpy.ops.sequencer.view_all_preview()
         scene = context.scene
-        vse_render = bpy.context.window_manager.UAS_vse_render
 
         start = scene.frame_preview_start if scene.use_preview_range else scene.frame_start
         end = scene.frame_preview_end if scene.use_preview_range else scene.frame_end
-        activeClip = scene.sequence_editor.active_strip
-        scene.sequence_editor.active_strip = None
-
-        if "TOCURRENTFRAME" == self.zoomMode:
-            bpy.ops.sequencer.view_frame()
-
-        elif "TIMERANGE" == self.zoomMode:
-            # doesn't work directly cause they include the active clip !!!
-            # bpy.ops.sequencer.view_all_preview()
-            # bpy.ops.sequencer.view_all()
-            # if context.scene.use_preview_range:
-            #     bpy.ops.sequencer.view_all_preview()
-            # else:
-            #     bpy.ops.sequencer.view_all()
-
-            # backup and clear selection
-            selArr = []
-            numSel = 0
-            for clip in scene.sequence_editor.sequences:
-                selArr.append(clip.select)
-                if clip.select:
-                    numSel += 1
-
-            #     bpy.ops.sequencer.select_all(action="SELECT")
-            bpy.ops.sequencer.select_all(action="DESELECT")
-            #     bpy.context.scene.sequence_editor.active_strip = None
-
-            vse_render.changeClipsChannel(scene, 1, 32)
 
-            tmpClip = scene.sequence_editor.sequences.new_effect(
-                "_tmp_clip-to_delete", "COLOR", 1, frame_start=start, frame_end=end
-            )
-            #  print("tmpClip: ", tmpClip)
-            tmpClip.select = True
-            #     bpy.ops.sequencer.select_all(action="DESELECT")
-            #     tmpClip.select = True
-
-            bpy.ops.sequencer.view_selected()
-            scene.sequence_editor.sequences.remove(tmpClip)
-            vse_render.changeClipsChannel(scene, 32, 1)
+        if "TOCURRENTFRAME" == self.zoomMode or "SELECTEDCLIPS" == self.zoomMode:
+            # the view operators of the sequencer include the active clip
+            activeClip = scene.sequence_editor.active_strip
+            scene.sequence_editor.active_strip = None
+            if "TOCURRENTFRAME" == self.zoomMode:
+                bpy.ops.sequencer.view_frame()
+            else:
+                bpy.ops.sequencer.view_selected()
+            scene.sequence_editor.active_strip = activeClip
+            return {"FINISHED"}
 
-            # restore selection
-            for i, clip in enumerate(scene.sequence_editor.sequences):
-                clip.select = selArr[i]
+        # the other modes compute the range to frame from the cached channel extents and zoom the view directly,
+        # the strips and the selection are not modified
+        area = utils_vse.getSequencerArea(context)
+        if area is None:
+            return {"CANCELLED"}
 
-        elif "SELECTEDCLIPS" == self.zoomMode:
-            bpy.ops.sequencer.view_selected()
+        if "TIMERANGE" == self.zoomMode:
+            utils_vse.setSequencerViewRange(area, start, end + 1)
 
         elif "ALLCLIPS" == self.zoomMode:
-            # by default view_all is the max range between all clips and the time range. We modify
-            # it so that only the clips are framed
-
-            bpy.ops.sequencer.select_all(action="SELECT")
-            if context.scene.use_preview_range:
-                #   bpy.ops.sequencer.set_range_to_strips(preview=True)
-                bpy.ops.sequencer.set_range_to_strips(preview=True)
-                bpy.ops.sequencer.view_all_preview()
-                scene.frame_preview_start = start
-                scene.frame_preview_end = end
-            else:
-                #  bpy.ops.sequencer.set_range_to_strips(preview=False)
-                bpy.ops.sequencer.set_range_to_strips(preview=False)
-                bpy.ops.sequencer.view_all()
-                scene.frame_start = start
-                scene.frame_end = end
+            channelIndex = utils_vse.getChannelIndex(scene)
+            extent = channelIndex.get_extent()
+            if extent is not None:
+                utils_vse.setSequencerViewRange(
+                    area, extent[0], extent[1], channelStart=1, channelEnd=channelIndex.get_num_used_channels() + 1
+                )
 
         elif "TRACKCLIPS" == self.zoomMode:
-            # backup and clear selection
-            selArr = []
-            numSel = 0
-            for clip in scene.sequence_editor.sequences:
-                selArr.append(clip.select)
-                if clip.select:
-                    numSel += 1
-
-            bpy.ops.sequencer.select_all(action="DESELECT")
-
-            # select only track clip
-            for clip in scene.sequence_editor.sequences:
-                clip.select = self.trackIndex == clip.channel
-            bpy.ops.sequencer.view_selected()
-
-            # restore selection
-            for i, clip in enumerate(scene.sequence_editor.sequences):
-                clip.select = selArr[i]
+            extent = utils_vse.getChannelIndex(scene).get_channel_extent(self.trackIndex)
+            if extent is not None:
+                utils_vse.setSequencerViewRange(
+                    area, extent[0], extent[1], channelStart=self.trackIndex, channelEnd=self.trackIndex + 1
+                )
 
         # for test only
         # filedit = bpy.context.window_manager.UAS_vse_render.getMediaList(context.scene, listVideo=False, listAudio=True)
@@ -250,7 +200,6 @@ class UAS_VideoTracks_ZoomView(Operator):
         # else:
         #     bpy.ops.sequencer.set_range_to_strips(preview=False)
 
-        bpy.context.scene.sequence_editor.active_strip = activeClip
         return {"FINISHED"}
 
 
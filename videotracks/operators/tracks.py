@@ -25,6 +25,8 @@ from bpy.props import StringProperty, BoolProperty, FloatVectorProperty, EnumPro
 
 from random import uniform
 
+from videotracks.utils import utils_vse
+
 
 def _list_scenes(self, context):
     res = list()
@@ -76,7 +78,7 @@ class UAS_VideoTracks_TrackAdd(Operator):
     )
 
     name: StringProperty(name="Name", default="New Track")
-    insertAtChannel: IntProperty(name="Insert at Channel", min=1, max=32, default=1)
+    insertAtChannel: IntProperty(name="Insert at Channel", min=1, max=utils_vse.getMaxNumChannels(), default=1)
 
     color: FloatVectorProperty(
         name="Color",
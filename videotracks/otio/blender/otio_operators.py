@@ -24,6 +24,8 @@ from pathlib import Path
 import json
 import subprocess
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import bpy
 from bpy.types import Operator
@@ -33,6 +35,7 @@ from bpy_extras.io_utils import ImportHelper
 # paths are relative in order to make the package not dependent on an add-on name
 from ...config import config
 from ...utils import utils
+from ...utils import utils_vse
 
 import opentimelineio
 from ..exports import exportShotManagerEditToOtio
@@ -272,6 +275,155 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_Simple(Operator):
         return {"FINISHED"}
 
 
+class EditFileLoadJob:
+    """ Read and parse an edit file into a MontageOtio in a worker thread so that the UI is not frozen
+        The montage is not set to config.gMontageOtio by the job: this has to be done by the caller from
+        the main thread once the job is done
+    """
+
+    def __init__(self, otioFile, importStepMode="PREDEC"):
+        self.otioFile = otioFile
+        self.importStepMode = importStepMode
+        self.progress = 0.0
+        self.progressText = ""
+        self._cancelEvent = threading.Event()
+        self._future = None
+
+    def start(self):
+        self._future = _get_edit_file_executor().submit(self._run)
+
+    def cancel(self):
+        self._cancelEvent.set()
+        if self._future is not None:
+            self._future.cancel()
+
+    def isCancelled(self):
+        return self._cancelEvent.is_set()
+
+    def done(self):
+        return self._future is not None and self._future.done()
+
+    def result(self):
+        """ Return a tuple (montage, refVideoTrackInd), or None if the job has been cancelled
+            Exceptions raised in the worker thread are raised again here
+        """
+        return self._future.result()
+
+    def _setProgress(self, progress, progressText):
+        self.progress = progress
+        self.progressText = progressText
+
+    def _run(self):
+        self._setProgress(0.05, "Reading edit file...")
+        montage = MontageOtio()
+        montage.initialize(self.otioFile)
+        if self.isCancelled():
+            return None
+
+        numVideoTracks = len(montage.timeline.video_tracks())
+        refVideoTrackInd = 0
+        if "PREVIZ" == self.importStepMode:
+            refVideoTrackInd = min(numVideoTracks - 1, 0)
+
+        self._setProgress(0.6, "Parsing shots...")
+        montage.fillMontageInfoFromOtioFile(refVideoTrackInd=refVideoTrackInd, verboseInfo=False)
+        if self.isCancelled():
+            return None
+
+        self._setProgress(1.0, "Done")
+        return (montage, refVideoTrackInd)
+
+
+_editFileExecutor = None
+
+
+def _get_edit_file_executor():
+    global _editFileExecutor
+    if _editFileExecutor is None:
+        _editFileExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="EditFileLoad")
+    return _editFileExecutor
+
+
+class UAS_ShotManager_OT_Load_Edit_File(Operator):
+    bl_idname = "uasshotmanager.load_edit_file"
+    bl_label = "Load Edit File"
+    bl_description = "Read and parse the edit file in background, then invoke the specified operator"
+    bl_options = {"INTERNAL"}
+
+    otioFile: StringProperty()
+    importStepMode: StringProperty(default="PREDEC")
+
+    # bl_idname of the operator to invoke once the edit file is loaded, with montageLoaded set to True
+    callerOperator: StringProperty(default="")
+    opArgs: StringProperty(default="")
+    # properties of the caller operator dumped to a json string, given back to it when it is invoked again
+    callerProperties: StringProperty(default="")
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        self._job = EditFileLoadJob(self.otioFile, importStepMode=self.importStepMode)
+        self._job.start()
+
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        return {"RUNNING_MODAL"}
+
+    def _end(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        if context.workspace is not None:
+            context.workspace.status_text_set(None)
+
+    def modal(self, context, event):
+        if "ESC" == event.type and not self._job.isCancelled():
+            # the reading of the file by otio cannot be interrupted, the result is dropped when it arrives
+            self._job.cancel()
+            print(f"Loading of edit file cancelled: {self.otioFile}")
+
+        if "TIMER" != event.type:
+            return {"PASS_THROUGH"}
+
+        context.window_manager.progress_update(int(self._job.progress * 100))
+        if context.workspace is not None:
+            if self._job.isCancelled():
+                statusText = f"Cancelling the loading of edit file {Path(self.otioFile).name}, waiting for the "
+                statusText += "current step to finish..."
+            else:
+                statusText = f"Loading edit file {Path(self.otioFile).name}:  {self._job.progressText}    "
+                statusText += "(Esc to cancel)"
+            context.workspace.status_text_set(statusText)
+
+        if not self._job.done():
+            return {"PASS_THROUGH"}
+
+        self._end(context)
+        if self._job.isCancelled():
+            return {"CANCELLED"}
+
+        try:
+            result = self._job.result()
+        except Exception as e:
+            _logger.error(f"Cannot load edit file {self.otioFile}: {e}")
+            utils.ShowMessageBox(f"Cannot load edit file: {e}", "Edit File Loading Failed", "ERROR")
+            return {"CANCELLED"}
+
+        if result is None:
+            return {"CANCELLED"}
+
+        config.gMontageOtio = result[0]
+        print(f"config.gMontageOtio name: {config.gMontageOtio.get_name()}")
+
+        if "" != self.callerOperator:
+            opCategory, opName = self.callerOperator.split(".")
+            callerProperties = json.loads(self.callerProperties) if "" != self.callerProperties else dict()
+            callerProperties.update(otioFile=self.otioFile, opArgs=self.opArgs, montageLoaded=True)
+            getattr(getattr(bpy.ops, opCategory), opName)("INVOKE_DEFAULT", **callerProperties)
+
+        return {"FINISHED"}
+
+
 class UAS_ShotManager_OT_Create_Shots_From_OTIO_Adv(Operator):
     bl_idname = "uasshotmanager.createshotsfromotio_adv"
     bl_label = "Import / Update Shots from Edit File"
@@ -328,6 +480,9 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_Adv(Operator):
     # can be "PREDEC" or "PREVIZ"
     importStepMode: StringProperty(default="PREDEC")
 
+    # True when the edit file has already been loaded in background into config.gMontageOtio
+    montageLoaded: BoolProperty(default=False, options={"HIDDEN", "SKIP_SAVE"})
+
     conformMode: EnumProperty(
         name="Conform Mode",
         description="Type of conformation to apply to the current scene",
@@ -538,7 +693,8 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_Adv(Operator):
                 if "mediaHandlesDuration" in argsDict:
                     self.mediaHandlesDuration = argsDict["mediaHandlesDuration"]
 
-        config.gMontageOtio = None
+        if not self.montageLoaded:
+            config.gMontageOtio = None
 
         if "" == self.otioFile:
             print(f"*** Otio file not defined - Cannot open edit file ***")
@@ -548,10 +704,21 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_Adv(Operator):
             print(f"***      Otio file: {self.otioFile}")
             return {"CANCELLED"}
 
-        if "" != self.otioFile and Path(self.otioFile).exists():
-            config.gMontageOtio = MontageOtio()
-            config.gMontageOtio.initialize(self.otioFile)
+        if not self.montageLoaded:
+            # the edit file is read and parsed in background, then this operator is invoked again
+            bpy.ops.uasshotmanager.load_edit_file(
+                "INVOKE_DEFAULT",
+                otioFile=self.otioFile,
+                importStepMode=self.importStepMode,
+                callerOperator=self.bl_idname,
+                opArgs=self.opArgs,
+                callerProperties=json.dumps(
+                    utils.getOperatorPropertyValues(self, excludedProperties=("otioFile", "opArgs", "montageLoaded"))
+                ),
+            )
+            return {"CANCELLED"}
 
+        if config.gMontageOtio is not None:
             config.gTracksEnumList = list()
             numVideoTracks = len(config.gMontageOtio.timeline.video_tracks())
             for i in range(0, numVideoTracks):
@@ -566,11 +733,6 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_Adv(Operator):
 
             self.refVideoTrackList = str(self.refVideoTrackInd)  # config.gTracksEnumList[0][0]
 
-            config.gMontageOtio.fillMontageInfoFromOtioFile(
-                refVideoTrackInd=int(self.refVideoTrackList), verboseInfo=False
-            )
-            print(f"config.gMontageOtio name: {config.gMontageOtio.get_name()}")
-
             # wkipwkipwkip not very context generic...
             # currentSeqName = (scene.name)[6:]
             # print(f"Current seq name: {currentSeqName}")
@@ -968,30 +1130,31 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_Adv(Operator):
             if config.devDebug:
                 bpy.ops.uasshotmanager.compare_otio_and_current_montage(sequenceName=selSeq.get_name())
 
-            textFile = conformToRefMontage(
-                context.scene,
-                config.gMontageOtio,
-                selSeq.get_name(),
-                mediaInEDLHaveHandles=self.mediaInEDLHaveHandles,
-                mediaInEDLHandlesDuration=self.mediaInEDLHandlesDuration,
-                clearVSE=self.clearVSE,
-                clearCameraBG=self.clearCameraBG,
-                changeShotsTiming=self.changeShotsTiming,
-                createMissingShots=self.createMissingShots,
-                createCameras=self.createCameras,
-                useMediaAsCameraBG=self.useMediaAsCameraBG,
-                videoShotsFolder=self.videoShotsFolder,
-                mediaHaveHandles=self.mediaHaveHandles,
-                mediaHandlesDuration=self.mediaHandlesDuration,
-                useMediaSoundtrackForCameraBG=self.useMediaSoundtrackForCameraBG,
-                #########
-                # VSE - No imports anymore
-                # importVideoInVSE=self.importVideoInVSE,
-                # importAudioInVSE=self.importAudioInVSE,
-                # videoTracksList=videoTracksToImport,
-                # audioTracksList=audioTracksToImport,
-                # animaticFile=self.animaticFile if self.importAnimaticInVSE else None,
-            )
+            with utils_vse.vse_batch(context.scene):
+                textFile = conformToRefMontage(
+                    context.scene,
+                    config.gMontageOtio,
+                    selSeq.get_name(),
+                    mediaInEDLHaveHandles=self.mediaInEDLHaveHandles,
+                    mediaInEDLHandlesDuration=self.mediaInEDLHandlesDuration,
+                    clearVSE=self.clearVSE,
+                    clearCameraBG=self.clearCameraBG,
+                    changeShotsTiming=self.changeShotsTiming,
+                    createMissingShots=self.createMissingShots,
+                    createCameras=self.createCameras,
+                    useMediaAsCameraBG=self.useMediaAsCameraBG,
+                    videoShotsFolder=self.videoShotsFolder,
+                    mediaHaveHandles=self.mediaHaveHandles,
+                    mediaHandlesDuration=self.mediaHandlesDuration,
+                    useMediaSoundtrackForCameraBG=self.useMediaSoundtrackForCameraBG,
+                    #########
+                    # VSE - No imports anymore
+                    # importVideoInVSE=self.importVideoInVSE,
+                    # importAudioInVSE=self.importAudioInVSE,
+                    # videoTracksList=videoTracksToImport,
+                    # audioTracksList=audioTracksToImport,
+                    # animaticFile=self.animaticFile if self.importAnimaticInVSE else None,
+                )
             props.setCurrentShotByIndex(0)
             props.setSelectedShotByIndex(0)
             props.display_camerabgtools_in_properties = True
@@ -1105,6 +1268,7 @@ class UAS_OTIO_OpenFileBrowser(Operator, ImportHelper):  # from bpy_extras.io_ut
 _classes = (
     UAS_ShotManager_Export_OTIO,
     UAS_ShotManager_OT_Create_Shots_From_OTIO_Simple,
+    UAS_ShotManager_OT_Load_Edit_File,
     UAS_ShotManager_OT_Create_Shots_From_OTIO_Adv,
     UAS_ShotManager_OT_CompareOtioAndCurrentMontage,
     UAS_OTIO_OpenFileBrowser,
@@ -1117,5 +1281,10 @@ def register():
 
 
 def unregister():
+    global _editFileExecutor
+    if _editFileExecutor is not None:
+        _editFileExecutor.shutdown(wait=False)
+        _editFileExecutor = None
+
     for cls in reversed(_classes):
         bpy.utils.unregister_class(cls)
@@ -139,6 +139,9 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_RRS(Operator):
     # can be "PREDEC" or "PREVIZ"
     importStepMode: StringProperty(default="PREDEC")
 
+    # True when the edit file has already been loaded in background into config.gMontageOtio
+    montageLoaded: BoolProperty(default=False, options={"HIDDEN", "SKIP_SAVE"})
+
     conformMode: EnumProperty(
         name="Conform Mode",
         description="Type of conformation to apply to the current scene",
@@ -334,7 +337,8 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_RRS(Operator):
                 if "mediaHandlesDuration" in argsDict:
                     self.mediaHandlesDuration = argsDict["mediaHandlesDuration"]
 
-        config.gMontageOtio = None
+        if not self.montageLoaded:
+            config.gMontageOtio = None
 
         if "" == self.otioFile:
             print(f"*** Otio file not defined - Cannot open edit file ***")
@@ -344,10 +348,21 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_RRS(Operator):
             print(f"***      Otio file: {self.otioFile}")
             return {"CANCELLED"}
 
-        if "" != self.otioFile and Path(self.otioFile).exists():
-            config.gMontageOtio = MontageOtio()
-            config.gMontageOtio.initialize(self.otioFile)
+        if not self.montageLoaded:
+            # the edit file is read and parsed in background, then this operator is invoked again
+            bpy.ops.uasshotmanager.load_edit_file(
+                "INVOKE_DEFAULT",
+                otioFile=self.otioFile,
+                importStepMode=self.importStepMode,
+                callerOperator=self.bl_idname,
+                opArgs=self.opArgs,
+                callerProperties=json.dumps(
+                    utils.getOperatorPropertyValues(self, excludedProperties=("otioFile", "opArgs", "montageLoaded"))
+                ),
+            )
+            return {"CANCELLED"}
 
+        if config.gMontageOtio is not None:
             config.gTracksEnumList = list()
             numVideoTracks = len(config.gMontageOtio.timeline.video_tracks())
             for i in range(0, numVideoTracks):
@@ -362,11 +377,6 @@ class UAS_ShotManager_OT_Create_Shots_From_OTIO_RRS(Operator):
 
             self.refVideoTrackList = str(self.refVideoTrackInd)  # config.gTracksEnumList[0][0]
 
-            config.gMontageOtio.fillMontageInfoFromOtioFile(
-                refVideoTrackInd=int(self.refVideoTrackList), verboseInfo=False
-            )
-            print(f"config.gMontageOtio name: {config.gMontageOtio.get_name()}")
-
             # wkipwkipwkip not very context generic...
             # currentSeqName = (scene.name)[6:]
             # print(f"Current seq name: {currentSeqName}")
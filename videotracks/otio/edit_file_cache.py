@@ -0,0 +1,187 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persistent cache of the parsed edit files.
+An edit file (Final Cut XML, OTIO...) is stored as a native .otio json file, with the data extracted
+from the xml file (clip names, sample characteristics...) in a .json side file.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+
+import opentimelineio
+
+from ..config import sm_logging
+
+_logger = sm_logging.getLogger(__name__)
+
+
+# to increase when the content of the side data changes
+CACHE_FORMAT_VERSION = 2
+
+# maximum size of the cache on disk, in bytes, before the least recently used entries are removed
+CACHE_MAX_SIZE = 500 * 1024 * 1024
+
+
+class EditFileCache:
+    """ Cache of edit files. Entries are keyed by the absolute path, the size and the modification time
+        of the edit file, and by the version of the otio package. The least recently used entries are removed
+        when the total size of the cache is bigger than maxSize
+    """
+
+    def __init__(self, cacheDir=None, maxSize=CACHE_MAX_SIZE):
+        if cacheDir is None:
+            cacheDir = Path(tempfile.gettempdir()).joinpath("UAS_VideoTracks", "EditFilesCache")
+        self.cacheDir = Path(cacheDir)
+        self.maxSize = maxSize
+
+    def _get_key(self, filePath):
+        """ Return the key of the cache entry of the file, None if the file doesn't exist
+        """
+        try:
+            fileStat = os.stat(filePath)
+        except OSError:
+            return None
+        keyStr = (
+            f"{os.path.normcase(os.path.abspath(filePath))}|{fileStat.st_size}|{fileStat.st_mtime_ns}"
+            f"|{opentimelineio.__version__}|{CACHE_FORMAT_VERSION}"
+        )
+        return hashlib.sha1(keyStr.encode("utf-8")).hexdigest()
+
+    def _get_entry_paths(self, key):
+        return (self.cacheDir.joinpath(key + ".otio"), self.cacheDir.joinpath(key + ".json"))
+
+    def load(self, filePath):
+        """ Return a tuple (timeline, sideData) for the specified edit file, None if it is not in the cache
+            sideData is None if it has not been stored yet
+        """
+        key = self._get_key(filePath)
+        if key is None:
+            return None
+        timelinePath, sideDataPath = self._get_entry_paths(key)
+        if not timelinePath.exists():
+            return None
+
+        try:
+            timeline = opentimelineio.adapters.read_from_file(str(timelinePath), adapter_name="otio_json")
+            sideData = None
+            if sideDataPath.exists():
+                with open(sideDataPath, "r", encoding="utf-8") as f:
+                    sideData = json.load(f).get("sideData")
+        except Exception as e:
+            _logger.warning(f"Cannot read cached edit file {timelinePath}: {e}")
+            self._remove_entry(key)
+            return None
+
+        # entries are sorted by access time for the eviction
+        for entryPath in (timelinePath, sideDataPath):
+            if entryPath.exists():
+                os.utime(entryPath)
+
+        _logger.debug_ext(f"Edit file loaded from cache: {filePath}", col="GREEN", tag="EDIT_IO")
+        return (timeline, sideData)
+
+    def store(self, filePath, timeline, sideData=None):
+        """ Add the timeline of the specified edit file to the cache
+        """
+        key = self._get_key(filePath)
+        if key is None:
+            return
+        timelinePath, _ = self._get_entry_paths(key)
+        try:
+            self.cacheDir.mkdir(parents=True, exist_ok=True)
+            tmpPath = timelinePath.with_suffix(".otio.tmp")
+            opentimelineio.adapters.write_to_file(timeline, str(tmpPath), adapter_name="otio_json")
+            os.replace(tmpPath, timelinePath)
+        except Exception as e:
+            _logger.warning(f"Cannot write edit file to cache {timelinePath}: {e}")
+            return
+
+        if sideData is not None:
+            self.store_side_data(filePath, sideData)
+        self._evict()
+
+    def store_side_data(self, filePath, sideData):
+        """ Set the side data of the cache entry of the specified edit file
+            sideData has to be serializable in json
+        """
+        key = self._get_key(filePath)
+        if key is None:
+            return
+        timelinePath, sideDataPath = self._get_entry_paths(key)
+        if not timelinePath.exists():
+            return
+        try:
+            with open(sideDataPath, "w", encoding="utf-8") as f:
+                json.dump({"source": os.path.abspath(filePath), "sideData": sideData}, f)
+        except Exception as e:
+            _logger.warning(f"Cannot write edit file side data to cache {sideDataPath}: {e}")
+
+    def _remove_entry(self, key):
+        for entryPath in self._get_entry_paths(key):
+            try:
+                entryPath.unlink()
+            except OSError:
+                pass
+
+    def _evict(self):
+        """ Remove the least recently used entries until the cache size is below maxSize
+        """
+        entries = dict()
+        try:
+            with os.scandir(self.cacheDir) as dirEntries:
+                for dirEntry in dirEntries:
+                    if not dirEntry.is_file():
+                        continue
+                    key = dirEntry.name.split(".")[0]
+                    entryStat = dirEntry.stat()
+                    size, lastAccess = entries.get(key, (0, 0))
+                    entries[key] = (size + entryStat.st_size, max(lastAccess, entryStat.st_mtime))
+        except OSError:
+            return
+
+        totalSize = sum(size for size, _ in entries.values())
+        for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if totalSize <= self.maxSize:
+                break
+            self._remove_entry(key)
+            totalSize -= size
+
+    def clear(self):
+        """ Remove all the entries of the cache
+        """
+        try:
+            with os.scandir(self.cacheDir) as dirEntries:
+                for dirEntry in dirEntries:
+                    if dirEntry.is_file():
+                        os.remove(dirEntry.path)
+        except OSError:
+            pass
+
+
+_editFileCache = None
+
+
+def get_edit_file_cache():
+    global _editFileCache
+    if _editFileCache is None:
+        _editFileCache = EditFileCache()
+    return _editFileCache
@@ -27,6 +27,7 @@ import opentimelineio
 from xml.dom.minidom import parse
 
 from videotracks.utils import utils_xml
+from videotracks.utils import utils_os
 from videotracks import display_version
 
 from videotracks.config import sm_logging
@@ -210,6 +211,7 @@ def exportShotManagerEditToOtio(
     videoClips = list()
     audioClips = list()
     playhead = 0
+    mediaResolver = utils_os.MediaResolver()
     for shot in shotList:
         if shot.enabled:
 
@@ -236,7 +238,7 @@ def exportShotManagerEditToOtio(
             shotFileName = Path(shotFileFullPath).name
 
             _logger.info(f" Adding shot: {shotFileFullPath}")
-            if not Path(shotFileFullPath).exists():
+            if not mediaResolver.exists(shotFileFullPath):
                 _logger.info("     *** File not found *** ")
 
             media_reference_video = opentimelineio.schema.ExternalReference(
@@ -0,0 +1,211 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Import plan of an otio timeline: the list of the strips to create in the VSE, computed without Blender.
+The plan is then applied to a scene by imports.applyImportPlan()
+This module doesn't use Blender so that the plan can be computed and tested outside of it
+"""
+
+from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
+
+import opentimelineio
+
+from ..utils import utils_os
+
+from .track_range_table import get_track_range_table
+
+
+class StripRecord(NamedTuple):
+    """ Description of a VSE strip to create from an otio clip
+        Frame values already include the import frame offset
+    """
+
+    name: str
+    media_path: str
+    channel: int
+    track_type: str  # "VIDEO" or "AUDIO"
+    frame_start: int
+    frame_final_start: int
+    frame_final_end: int
+    frame_offset_start: int
+    frame_offset_end: int
+    frame_final_duration: int
+    mute: bool = False
+    volume: Optional[float] = None
+    volume_keys: Tuple[Tuple[int, float], ...] = ()
+
+
+class ImportPlan(NamedTuple):
+    """ Strips to create, in creation order, and the clips which media have not been found
+        missing_media is a tuple of (clip name, media path)
+    """
+
+    strips: Tuple[StripRecord, ...] = ()
+    missing_media: Tuple[Tuple[str, str], ...] = ()
+
+
+def _get_clip_mute(clip):
+    clipEnabled = True
+    if "fcp_xml" in clip.metadata:
+        if "enabled" in clip.metadata["fcp_xml"]:
+            clipEnabled = not ("FALSE" == clip.metadata["fcp_xml"]["enabled"])
+    return not clipEnabled
+
+
+def _get_clip_volume(clip):
+    """ Return the volume value of the audio clip, None if not specified
+    """
+    volume = None
+    if "fcp_xml" in clip.metadata:
+        effect = clip.metadata["fcp_xml"].get("filter", {}).get("effect", {})
+        if "parameter" in effect and "value" in effect["parameter"]:
+            volume = float(effect["parameter"]["value"])
+    return volume
+
+
+def _get_clip_volume_keys(clip):
+    """ Return the volume keyframes of the audio clip as a tuple of (frame, value)
+    """
+    audio_volume_keyframes = []
+    if clip.metadata is not None:
+        effect = clip.metadata.get("fcp_xml", {}).get("filter", {}).get("effect")
+        if effect is not None and effect["effectcategory"] == "audiolevels":
+            keyframe_data = effect.get("parameter", {}).get("keyframe")
+            if keyframe_data is not None:
+                if not isinstance(keyframe_data, opentimelineio._otio.AnyVector):
+                    keyframe_data = [keyframe_data]
+                for keyframe in keyframe_data:
+                    frame = opentimelineio.opentime.to_frames(
+                        opentimelineio.opentime.RationalTime(float(keyframe["when"]))
+                    )
+                    audio_volume_keyframes.append((frame, float(keyframe["value"])))
+    return tuple(audio_volume_keyframes)
+
+
+def planTrack(
+    track,
+    trackInd,
+    track_type,
+    timeRange=None,
+    offsetFrameNumber=0,
+    alternative_media_folder="",
+    fps=25,
+    media_resolver=None,
+):
+    """ Return the strip records and the missing media of the clips of the track
+        trackInd is the index of the VSE channel receiving the clips
+        track_type can be "VIDEO" or "AUDIO"
+        Media not found at their path are looked for by name in alternative_media_folder
+    """
+    if media_resolver is None:
+        media_resolver = utils_os.MediaResolver()
+    search_roots = [alternative_media_folder] if alternative_media_folder else []
+    strips = list()
+    missing_media = list()
+
+    range_start = -9999999
+    range_end = 9999999
+    if timeRange is not None:
+        range_start = timeRange[0]
+        range_end = timeRange[1]
+
+    # the rows of the table are media clips, see TrackRangeTable
+    rangeTable = get_track_range_table(track, fps, nested_clips=True)
+
+    for i, clip in enumerate(rangeTable.clips):
+        # clips partly inside the range are kept
+        if rangeTable.end_inclusive[i] < range_start or range_end < rangeTable.frame_final_start[i]:
+            continue
+
+        media_path = utils_os.file_path_from_url(clip.media_reference.target_url)
+        resolved_path = media_resolver.resolve(media_path, search_roots=search_roots)
+        if resolved_path is None:
+            missing_media.append((clip.name, str(Path(alternative_media_folder).joinpath(Path(media_path).name))))
+            continue
+
+        volume = None
+        volume_keys = ()
+        if "AUDIO" == track_type:
+            volume = _get_clip_volume(clip)
+            volume_keys = _get_clip_volume_keys(clip)
+
+        strips.append(
+            StripRecord(
+                name=clip.name,
+                media_path=resolved_path,
+                channel=trackInd,
+                track_type=track_type,
+                frame_start=rangeTable.frame_start[i] + offsetFrameNumber,
+                frame_final_start=rangeTable.frame_final_start[i] + offsetFrameNumber,
+                frame_final_end=rangeTable.frame_final_end[i] + offsetFrameNumber,
+                frame_offset_start=rangeTable.frame_offset_start[i],
+                frame_offset_end=rangeTable.frame_offset_end[i],
+                frame_final_duration=rangeTable.frame_final_duration[i],
+                mute=_get_clip_mute(clip),
+                volume=volume,
+                volume_keys=volume_keys,
+            )
+        )
+
+    return strips, missing_media
+
+
+def planImport(
+    timeline,
+    timeRange=None,
+    offsetFrameNumber=0,
+    track_type="ALL",
+    videoTracksList=None,
+    audioTracksList=None,
+    alternative_media_folder="",
+    fps=25,
+    media_resolver=None,
+):
+    """ Return the ImportPlan of the timeline
+        Video tracks are planned before audio tracks, each one on the channel of its index + 1
+        track_type can be "ALL", "VIDEO" or "AUDIO"
+    """
+    if media_resolver is None:
+        media_resolver = utils_os.MediaResolver()
+    strips = list()
+    missing_media = list()
+
+    def _planTracks(tracks, tracksList, trackType):
+        for trackInd, editTrack in enumerate(tracks):
+            if tracksList is None or (trackInd + 1) in tracksList:
+                trackStrips, trackMissingMedia = planTrack(
+                    editTrack,
+                    trackInd + 1,
+                    trackType,
+                    timeRange=timeRange,
+                    offsetFrameNumber=offsetFrameNumber,
+                    alternative_media_folder=alternative_media_folder,
+                    fps=fps,
+                    media_resolver=media_resolver,
+                )
+                strips.extend(trackStrips)
+                missing_media.extend(trackMissingMedia)
+
+    if "ALL" == track_type or "VIDEO" == track_type:
+        _planTracks(timeline.video_tracks(), videoTracksList, "VIDEO")
+
+    if "ALL" == track_type or "AUDIO" == track_type:
+        _planTracks(timeline.audio_tracks(), audioTracksList, "AUDIO")
+
+    return ImportPlan(strips=tuple(strips), missing_media=tuple(missing_media))
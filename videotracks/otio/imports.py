@@ -33,248 +33,92 @@ import opentimelineio
 from .. import config
 from ..utils import utils
 from ..utils import utils_vse
+from ..utils import utils_os
+
+from ..properties import montage_diff
 
 from . import otio_wrapper as ow
+from . import import_plan
 
 from ..config import sm_logging
 
 _logger = sm_logging.getLogger(__name__)
 
 
-def importTrack(track, trackInd, track_type, timeRange=None, offsetFrameNumber=0, alternative_media_folder=""):
-    verbose = False
-    #   verbose = "VIDEO" == track_type
-
-    trackInfo = "\n\n------------------------------------------------------------"
-    trackInfo += "\n------------------------------------------------------------"
-    trackInfo += "\n  - Track {trackInd}: {track.name}, {track_type}"
-
-    range_start = -9999999
-    range_end = 9999999
-    fps = 25
-    if timeRange is not None:
-        range_start = timeRange[0]
-        range_end = timeRange[1]
-        trackInfo += f" - import from {range_start} to {range_end} (included)"
-    if verbose:
-        print(f"{trackInfo}")
-
-    for i, clip in enumerate(track.each_clip()):
-        # if 5 < i:
-        #    break
-        clip_start = ow.get_clip_frame_final_start(clip, fps)
-        clip_end = ow.get_timeline_clip_end_inclusive(clip)
-
-        clipInfo = "\n\n- *** ----------------------------"
-        clipInfo += f"\n  - Clip name: {clip.name}, Clip ind: {i}"
-
-        isInRange = utils.segment_is_in_range(clip_start, clip_end, range_start, range_end, partly_inside=True)
-
-        # excluse media out of range
-        if not isInRange:
-            # excludInfo = " not in range"
-            # print(f"{excludInfo}")
+def applyImportPlan(scene, plan, verbose=False):
+    """ Create in the VSE of the scene the strips described by the import plan (see import_plan.ImportPlan)
+        Return the list of the created strips
+    """
+    vse_render = bpy.context.window_manager.UAS_vse_render
+    createNewClip = vse_render.createNewClip
+    newClips = list()
+
+    for _, media_path in plan.missing_media:
+        print(f"    *** Media not found: {media_path}")
+
+    for strip in plan.strips:
+        newClipInVSE = createNewClip(
+            scene,
+            strip.media_path,
+            strip.channel,
+            strip.frame_start,
+            offsetStart=strip.frame_offset_start,
+            offsetEnd=strip.frame_offset_end,
+            importVideo=strip.track_type == "VIDEO",
+            importAudio=strip.track_type == "AUDIO",
+            clipName=strip.name,
+        )
+        if newClipInVSE is None:
             continue
 
-        media_path = Path(ow.get_clip_media_path(clip))
+        newClipInVSE.mute = strip.mute
 
-        # possibly excluse some media types
-        # mediaExt = Path(media_path).suffix
-        # if mediaExt == ".wav":
-        #     excludInfo = "    ** Media exluded: "
-        #     continue
+        if strip.volume is not None:
+            newClipInVSE.volume = strip.volume
+        for f, v in strip.volume_keys:
+            newClipInVSE.volume = v
+            newClipInVSE.keyframe_insert("volume", frame=f)
 
-        clipInfo += f", media: {media_path}"
-        # clipInfo += f"\n  -   metadata:{clip.metadata['fcp_xml']}\n"
-        clipInfo += f"\n  -   metadata:{clip.metadata}\n"
         if verbose:
-            print(f"{clipInfo}")
-            print(f"clip_start: {clip_start}, clip_end: {clip_end}, range_start: {range_start}, range_end: {range_end}")
-            # _logger.debug(f"{clipInfo}")
-
-            # print(f"{clip}")
-            #   print(f"       Import Otio media_path: {media_path}")
-
-            # print(f"{clipInfo}")
-            # print(f"{clip}")
-
-            # print("       Clip is in range")
-            #    print(f"{clipInfo}")
-            # offsetFrameNumber = 2
-            #    _logger.debug(f"media_path: {media_path}")
-            print(f"       Import at frame: offsetFrameNumber: {offsetFrameNumber}")
-        if not media_path.exists():
-            print(f"    *** Media not found: {media_path}")
-            # Lets find it inside next to the xml
-            # media_path = Path(otioFile).parent.joinpath(media_path.name)
-            media_path = Path(alternative_media_folder).joinpath(media_path.name)
-            _logger.debug(f'** media not found, so using alternative_media_folder: "{alternative_media_folder}"')
-            _logger.debug(f"   and new media_path: {media_path}")
-
-        if not media_path.exists():
-            print(f"    *** Media still not found: {media_path}")
-        else:
-            media_path = str(media_path)
-
-            # start = ow.get_clip_frame_final_start(clip) + offsetFrameNumber
-            start = opentimelineio.opentime.to_frames(clip.range_in_parent().start_time)
-            end = ow.get_timeline_clip_end_inclusive(clip) + offsetFrameNumber
-            availableRange = clip.available_range()
-            # _logger.debug(f"  clip.available_range(): {clip.available_range()}")
-            # _logger.debug(f"  clip.available_range().duration: {clip.available_range().duration}")
-            # _logger.debug(
-            #     f"  clip.available_range().rescaled_to(25): {(clip.available_range().end_time_inclusive()).rescaled_to(25)}"
-            # )
-            # _logger.debug(
-            #     f"  clip.available_range().value_rescaled_to(25): {clip.available_range().end_time_exclusive().value_rescaled_to(25)}"
-            # )
-
-            offsetEnd = (
-                start
-                + clip.available_range().end_time_exclusive().value_rescaled_to(25)
-                - opentimelineio.opentime.to_frames(clip.range_in_parent().end_time_exclusive())
-                - opentimelineio.opentime.to_frames(clip.source_range.start_time)
-            )
+            vse_render.printClipInfo(newClipInVSE, printTimeInfo=True)
 
-            frameStart = ow.get_clip_frame_start(clip, fps)
-            frameEnd = ow.get_clip_frame_end(clip, fps)
-            frameFinalStart = ow.get_clip_frame_final_start(clip, fps)
-            frameFinalEnd = ow.get_clip_frame_final_end(clip, fps)
-            frameOffsetStart = ow.get_clip_frame_offset_start(clip, fps)
-            frameOffsetEnd = ow.get_clip_frame_offset_end(clip, fps)
-            frameDuration = ow.get_clip_frame_duration(clip, fps)
-            frameFinalDuration = ow.get_clip_frame_final_duration(clip, fps)
-
-            frameStart += offsetFrameNumber
-            frameEnd += offsetFrameNumber
-            frameFinalStart += offsetFrameNumber
-            frameFinalEnd += offsetFrameNumber
-
-            _logger.debug(
-                f"Abs clip values: clip frameStart: {frameStart}, frameFinalStart:{frameFinalStart}, frameFinalEnd:{frameFinalEnd}, frameEnd: {frameEnd}"
-            )
-            _logger.debug(
-                f"Rel clip values: clip frameOffsetStart: {frameOffsetStart}, frameOffsetEnd:{frameOffsetEnd}"
-            )
-            _logger.debug(
-                f"Duration clip values: clip frameDuration: {frameDuration}, frameFinalDuration:{frameFinalDuration}"
-            )
+        # fix to prevent the fact that the sound is sometimes longer than expected by 1 frame
+        if newClipInVSE.frame_final_duration > strip.frame_final_duration:
+            newClipInVSE.frame_final_duration = strip.frame_final_duration
 
-            vse_render = bpy.context.window_manager.UAS_vse_render
-            newClipInVSE = vse_render.createNewClip(
-                bpy.context.scene,
-                media_path,
-                trackInd,
-                frameStart,
-                offsetStart=frameOffsetStart,
-                offsetEnd=frameOffsetEnd,
-                importVideo=track_type == "VIDEO",
-                importAudio=track_type == "AUDIO",
-                clipName=clip.name,
-            )
+        newClips.append(newClipInVSE)
 
-            if newClipInVSE is not None:
-
-                clipEnabled = True
-                if verbose:
-                    print(f" -*- clip metadata: {clip.metadata}")
-
-                if "fcp_xml" in clip.metadata:
-                    # print(" -*- fcp_xml is ok")
-                    # print(f"metadata; clip.metadata['fcp_xml']['enabled']: {clip.metadata['fcp_xml']['enabled']}")
-                    if "enabled" in clip.metadata["fcp_xml"]:
-                        clipEnabled = not ("FALSE" == clip.metadata["fcp_xml"]["enabled"])
-                newClipInVSE.mute = not clipEnabled
-
-                if track_type == "AUDIO":
-                    if "fcp_xml" in clip.metadata:
-                        if "filter" in clip.metadata["fcp_xml"]:
-                            if "effect" in clip.metadata["fcp_xml"]["filter"]:
-                                if "parameter" in clip.metadata["fcp_xml"]["filter"]["effect"]:
-                                    if "parameter" in clip.metadata["fcp_xml"]["filter"]["effect"]:
-                                        if "value" in clip.metadata["fcp_xml"]["filter"]["effect"]["parameter"]:
-                                            volumeVal = float(
-                                                clip.metadata["fcp_xml"]["filter"]["effect"]["parameter"]["value"]
-                                            )
-                                            if verbose:
-                                                print(f" volume value: {volumeVal}")
-                                            newClipInVSE.volume = volumeVal
-
-                    audio_volume_keyframes = []
-                    if clip.metadata is not None:
-                        effect = clip.metadata.get("fcp_xml", {}).get("filter", {}).get("effect")
-                        if effect is not None and effect["effectcategory"] == "audiolevels":
-                            keyframe_data = effect.get("parameter", {}).get("keyframe")
-                            if keyframe_data is not None:
-                                if isinstance(keyframe_data, opentimelineio._otio.AnyVector):
-                                    for keyframe in keyframe_data:
-                                        frame = opentimelineio.opentime.to_frames(
-                                            opentimelineio.opentime.RationalTime(float(keyframe["when"]))
-                                        )
-                                        audio_volume_keyframes.append((frame, float(keyframe["value"])))
-                                else:
-                                    frame = opentimelineio.opentime.to_frames(
-                                        opentimelineio.opentime.RationalTime(float(keyframe_data["when"]))
-                                    )
-                                    audio_volume_keyframes.append((frame, float(keyframe_data["value"])))
-
-                    for f, v in audio_volume_keyframes:
-                        newClipInVSE.volume = v
-                        newClipInVSE.keyframe_insert("volume", frame=f)
-
-            if verbose:
-                vse_render.printClipInfo(newClipInVSE, printTimeInfo=True)
-            # _logger.debug(f"newClipInVSE: {newClipInVSE.name}")
-
-            # frameStart = newClipInVSE.frame_start
-            # frameEnd = -1  # newClipInVSE.frame_end
-            # frameFinalStart = newClipInVSE.frame_final_start
-            # frameFinalEnd = newClipInVSE.frame_final_end
-            # frameOffsetStart = newClipInVSE.frame_offset_start
-            # frameOffsetEnd = newClipInVSE.frame_offset_end
-            # frameDuration = newClipInVSE.frame_duration
-            # frameFinalDuration = newClipInVSE.frame_final_duration
-
-            # frameStart += offsetFrameNumber
-            # frameEnd += offsetFrameNumber
-            # frameFinalStart += offsetFrameNumber
-            # frameFinalEnd += offsetFrameNumber
-
-            # _logger.debug(
-            #     f"Abs clip values: clip frameStart: {frameStart}, frameFinalStart:{frameFinalStart}, frameFinalEnd:{frameFinalEnd}, frameEnd: {frameEnd}"
-            # )
-            # _logger.debug(
-            #     f"Rel clip values: clip frameOffsetStart: {frameOffsetStart}, frameOffsetEnd:{frameOffsetEnd}"
-            # )
-            # _logger.debug(
-            #     f"Duration clip values: clip frameDuration: {frameDuration}, frameFinalDuration:{frameFinalDuration}"
-            # )
-
-            # fix to prevent the fact that the sound is sometimes longer than expected by 1 frame
-            if newClipInVSE.frame_final_duration > ow.get_clip_frame_final_duration(clip, fps):
-                if verbose:
-                    print(
-                        f"newClipInVSE.frame_final_duration: {newClipInVSE.frame_final_duration}, ow.get_clip_frame_final_duration(clip, fps): {ow.get_clip_frame_final_duration(clip, fps)}"
-                    )
-                # newClipInVSE.frame_offset_end = -1 * (
-                #     newClipInVSE.frame_final_duration - ow.get_clip_frame_final_duration(clip, fps)
-                # )
-                newClipInVSE.frame_final_duration = ow.get_clip_frame_final_duration(clip, fps)
+    return newClips
 
-            # bpy.context.window_manager.UAS_vse_render.createNewClip(
-            #     bpy.context.scene,
-            #     media_path,
-            #     trackInd,
-            #     start - otio_clipLocalCutStart,
-            #     offsetStart=otio_clipLocalCutStart,
-            #     offsetEnd=offsetEnd,
-            #     # offsetEnd=end - otio_clipLocalCutStart + trimmedClipDuration,
-            #     # trimmedClipDuration=trimmedClipDuration,
-            #     importVideo=track_type == "VIDEO",
-            #     importAudio=track_type == "AUDIO",
-            # )
 
-    pass
+def importTrack(
+    track,
+    trackInd,
+    track_type,
+    timeRange=None,
+    offsetFrameNumber=0,
+    alternative_media_folder="",
+    media_resolver=None,
+):
+    verbose = False
+    #   verbose = "VIDEO" == track_type
+
+    fps = 25
+    if verbose:
+        print(f"\n  - Track {trackInd}: {track.name}, {track_type}")
+
+    strips, missing_media = import_plan.planTrack(
+        track,
+        trackInd,
+        track_type,
+        timeRange=timeRange,
+        offsetFrameNumber=offsetFrameNumber,
+        alternative_media_folder=alternative_media_folder,
+        fps=fps,
+        media_resolver=media_resolver,
+    )
+    plan = import_plan.ImportPlan(strips=tuple(strips), missing_media=tuple(missing_media))
+    return applyImportPlan(bpy.context.scene, plan, verbose=verbose)
 
 
 def importToVSE(
@@ -286,42 +130,31 @@ def importToVSE(
     videoTracksList=None,
     audioTracksList=None,
     alternative_media_folder="",
+    media_resolver=None,
 ):
     """
         track_type can be "ALL", "VIDEO" or "AUDIO"
+        media_resolver: utils_os.MediaResolver used to find the media, can be shared between several imports
+        The import is done in 2 steps: the import plan of the timeline is computed first (no Blender
+        data is touched), then all the strips are created at once
     """
     # print(f"\nimportToVSE: track_type: {track_type}")
 
     # alternative_media_folder = Path(otioFile).parent
 
-    # bpy.context.scene.frame_start = -999999
-    # bpy.context.scene.frame_end = 999999
-
-    # video
-    if "ALL" == track_type or "VIDEO" == track_type:
-        for trackInd, editTrack in enumerate(timeline.video_tracks()):
-            if videoTracksList is None or (trackInd + 1) in videoTracksList:
-                importTrack(
-                    editTrack,
-                    trackInd + 1,
-                    "VIDEO",
-                    timeRange=timeRange,
-                    offsetFrameNumber=offsetFrameNumber,
-                    alternative_media_folder=alternative_media_folder,
-                )
+    plan = import_plan.planImport(
+        timeline,
+        timeRange=timeRange,
+        offsetFrameNumber=offsetFrameNumber,
+        track_type=track_type,
+        videoTracksList=videoTracksList,
+        audioTracksList=audioTracksList,
+        alternative_media_folder=alternative_media_folder,
+        media_resolver=media_resolver,
+    )
+    _logger.debug(f"importToVSE: {len(plan.strips)} strips to create, {len(plan.missing_media)} media not found")
 
-    # audio
-    if "ALL" == track_type or "AUDIO" == track_type:
-        for trackInd, editTrack in enumerate(timeline.audio_tracks()):
-            if audioTracksList is None or (trackInd + 1) in audioTracksList:
-                importTrack(
-                    editTrack,
-                    trackInd + 1,
-                    "AUDIO",
-                    timeRange=timeRange,
-                    offsetFrameNumber=offsetFrameNumber,
-                    alternative_media_folder=alternative_media_folder,
-                )
+    return applyImportPlan(bpy.context.scene, plan)
 
 
 def getSequenceListFromOtio(otioFile):
@@ -421,6 +254,8 @@ def createShotsFromOtio(
     if mediaHaveHandles:
         handlesDuration = mediaHandlesDuration
 
+    mediaResolver = utils_os.MediaResolver()
+
     try:
         timeline = opentimelineio.adapters.read_from_file(otioFile)
         if len(timeline.video_tracks()):
@@ -451,7 +286,7 @@ def createShotsFromOtio(
                         print("Import Otio clip.media_reference.target_url: ", clip.media_reference.target_url)
                         media_path = Path(utils.file_path_from_url(clip.media_reference.target_url))
                         print("Import Otio media_path: ", media_path)
-                        if not media_path.exists():
+                        if not mediaResolver.exists(media_path):
                             # Lets find it inside next to the xml
                             media_path = Path(otioFile).parent.joinpath(media_path.name)
                             print("** not found, so Path(self.otioFile).parent: ", Path(otioFile).parent)
@@ -545,6 +380,7 @@ def createShotsFromOtioTimelineClass(
             offsetFrameNumber = importAtFrame - timeRange[0]
 
     print(f"Import Otio File: {montageOtio.otioFile}, num clips: {len(clipList)}")
+    mediaResolver = utils_os.MediaResolver()
     if timeRange is not None:
         print(f"   from {timeRange[0]} to {timeRange[1]} (included)")
 
@@ -593,10 +429,10 @@ def createShotsFromOtioTimelineClass(
                         # print("Import Otio media_path 1: ", media_path)
                         media_path = Path(media_path)
                         # print("Import Otio media_path 2: ", media_path)
-                        if not media_path.exists():
+                        if not mediaResolver.exists(media_path):
                             # Lets find it inside next to the xml
-                            media_path = Path(otioFile).parent.joinpath(media_path.name)
-                            print("** not found, so Path(self.otioFile).parent: ", Path(otioFile).parent)
+                            media_path = Path(montageOtio.otioFile).parent.joinpath(media_path.name)
+                            print("** not found, so Path(self.otioFile).parent: ", Path(montageOtio.otioFile).parent)
                             print("   and new media_path: ", media_path)
 
                         # start frame of the background video is not set here since it will be linked to the shot start frame
@@ -649,6 +485,7 @@ def createShotsFromOtioTimelineClass(
                     videoTracksList=videoTracksList,
                     audioTracksList=audioTracksList,
                     alternative_media_folder=Path(montageOtio.otioFile).parent,
+                    media_resolver=mediaResolver,
                 )
 
                 # restore workspace
@@ -840,6 +677,9 @@ def conformToRefMontage(
         return
 
     take = props.getTakeByIndex(takeInd)
+
+    # media are looked for in videoShotsFolder, listed only once
+    mediaResolver = utils_os.MediaResolver()
     shotList = props.get_shots(takeIndex=takeInd)
 
     if not mediaInEDLHaveHandles:
@@ -944,28 +784,31 @@ def conformToRefMontage(
     # comparedShotsList = selfSeq.getEditShots(ignoreDisabled=False)  # .copy()  # .getEditShots()
 
     # newEditShots = list()
-    numShotsInRefEdit = len(refSeq.getEditShots())
-    expectedIndInSelfEdit = 0
+    renderShotPrefix = props.getRenderShotPrefix() + "_"
+    montageDiff = montage_diff.diffShots(
+        refSeq.getEditShots(),
+        shotList,
+        refKey=lambda shotRef: Path(shotRef.get_name()).stem,
+        key=lambda sh: renderShotPrefix + sh.get_name(),
+    )
+
+    # current indices of the take shots, the conformed shots are moved one by one at the start of the take
+    shotPositions = montage_diff.ShotPositions(len(shotList))
+
+    numShotsInRefEdit = len(montageDiff.matches)
     previousShotSelf = None
     shotIndForBGCam = 0
-    for indInRefEdit, shot in enumerate(refSeq.getEditShots()):
-        shotRef = shot
+    for shotChange in montageDiff.matches:
+        indInRefEdit = shotChange.ref_index
+        shotRef = shotChange.ref_shot
         textRef = shotRef.get_name()
-        shotRefName = Path(shotRef.get_name()).stem
+        shotRefName = shotChange.key
         shotRefType = shotRef.get_type()
 
         shotSelfModifs = []
 
         shotSelf = None
-        for sh in shotList:
-            # if sh.get_name() == shotRef.get_name():
-            shotName = props.getRenderShotPrefix() + "_" + sh.get_name()
-            # print(f"shotName: {shotName}, shotRefName: {shotRefName}")
-            if shotName == shotRefName:
-                shotSelf = sh
-                break
-
-        if shotSelf is None:
+        if shotChange.has_change(montage_diff.ADDED):
             # wkip pb: we have no idea of the timing for the new shot...
 
             # media_path = Path(utils.file_path_from_url(clip.media_reference.target_url))
@@ -1008,8 +851,8 @@ def conformToRefMontage(
                         noteStr += ref_montage.get_name()
                     shotSelf.note01 = noteStr
 
-                    shotSelf = props.moveShotToIndex(shotSelf, expectedIndInSelfEdit)
-                    expectedIndInSelfEdit += 1
+                    shotSelf = props.moveShotToIndex(shotSelf, shotPositions.numConformed)
+                    shotPositions.conform()
 
                     modifStr = f"{shotSelf.get_name()}:  "
                     modifStr += " *** New shot ***"
@@ -1028,18 +871,32 @@ def conformToRefMontage(
                 textSelf = modifStr
                 shotSelfModifs.append(modifStr)
 
+        elif shotChange.has_change(montage_diff.DUPLICATE):
+            # the matching shot has already been conformed to a previous ref shot
+            modifStr = f"- (No shot created, ref shot name already used in the edit)"
+            textSelf = modifStr
+            shotSelfModifs.append(modifStr)
+
         else:
+            shotInd = shotPositions.get_index(shotChange.index)
+            shotSelf = shotList[shotInd]
+
             modifStr = f"{shotSelf.get_name()}  "
             textSelf = modifStr
             shotSelfModifs.append(modifStr)
 
             # set shot position in take edit
-            shotInd = props.getShotIndex(shotSelf)
-            if expectedIndInSelfEdit != shotInd:
-                shotSelf = props.moveShotToIndex(shotSelf, expectedIndInSelfEdit)
+            if shotPositions.numConformed != shotInd:
+                shotSelf = props.moveShotToIndex(shotSelf, shotPositions.numConformed)
+            shotPositions.conform(shotChange.index)
+
+            if shotChange.has_change(montage_diff.MOVED):
+                modifStr = "moved"
+                shotSelfModifs.append(modifStr)
+                textSelf += f" / {modifStr}"
 
             # newEditShots.append(shotSelf)
-            if not shotSelf.enabled:
+            if shotChange.has_change(montage_diff.ENABLED):
                 modifStr = "enabled"
                 shotSelfModifs.append(modifStr)
                 textSelf += f" / {modifStr}"
@@ -1067,8 +924,6 @@ def conformToRefMontage(
 
                 shotSelf.durationLocked = True
 
-            expectedIndInSelfEdit += 1
-
             # make camera unique
             if useMediaAsCameraBG:
                 if shotSelf.camera is not None and 1 < props.getNumSharedCamera(shotSelf.camera):
@@ -1098,7 +953,7 @@ def conformToRefMontage(
                     modifStr = f"New cam BG: {media_path.name}"
                     textSelf += f" / {modifStr}"
 
-                    if not media_path.exists():
+                    if not mediaResolver.exists(media_path):
                         print(f"** BG video shot not found: {media_path}")
                         modifStr += f" (!!! Not Found in {media_path.parent})"
                         textSelf += f" (!!! Not Found in {media_path.parent})"
@@ -1199,10 +1054,12 @@ def conformToRefMontage(
     infoStr += f"\n\n   Shots not used in current sequence (and then disabled):"
     infoStr += f"\n   -------------------------------------------------------\n"
 
-    ind = 0
-    for i in range(expectedIndInSelfEdit, len(shotList)):
+    for shotChange in montageDiff.removed:
         shotSelfModifs = []
 
+        # removed shots are after the conformed ones, in their initial order
+        i = shotPositions.get_index(shotChange.index)
+
         # if shotList[i] not in newEditShots:
         if not shotList[i].name.endswith("_removed"):
             shotList[i].name += "__removed"
@@ -1227,7 +1084,6 @@ def conformToRefMontage(
 
         # infoStr += printInfoLine(str(ind + numShotsInRefEdit), "-", modifsSelf=shotSelfModifs)
         infoStr += printInfoLine("", "-", modifsSelf=shotSelfModifs, jumpLine=False)
-        ind += 1
 
         ###################
         # clear camera BG
@@ -1236,7 +1092,7 @@ def conformToRefMontage(
         #     if shotList[i].camera is not None:
         #         utils.remove_background_video_from_cam(shotList[i].camera.data)
 
-    if 0 == ind:
+    if not len(montageDiff.removed):
         infoStr += printInfoLine("", "-", "-")
 
     ###################
@@ -1296,6 +1152,7 @@ def conformToRefMontage(
                 videoTracksList=videoTracksList,
                 audioTracksList=audioTracksList,
                 alternative_media_folder=Path(ref_montage.otioFile).parent,
+                media_resolver=mediaResolver,
             )
 
             # add videos from the edit
@@ -1310,7 +1167,7 @@ def conformToRefMontage(
                 if "" == media_path.suffix:
                     media_path = Path(str(media_path) + ".mp4")
 
-                if not media_path.exists():
+                if not mediaResolver.exists(media_path):
                     print(f"** Edit video shot not found for VSE: {media_path}")
                 else:
                     newClipInVSE = vse_render.createNewClip(
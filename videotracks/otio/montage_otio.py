@@ -30,6 +30,7 @@ from ..properties.montage_interface import MontageInterface, SequenceInterface,
 
 # from ..otio import otio_wrapper as ow
 from . import otio_wrapper as ow
+from . import edit_file_cache
 import opentimelineio
 
 from ..config import sm_logging
@@ -47,17 +48,65 @@ class MontageOtio(MontageInterface):
         # new properties:
         self.otioFile = None
         self.timeline = None
+        self._rangeTables = dict()
+
+        # data read in the xml file and not available in the otio timeline (clip names, characteristics...)
+        self._xmlSideData = None
+        self._useCache = True
         # self.seqCharacteristics = None
         # self.videoCharacteristics = None
 
-    def initialize(self, otioFile, read=True):
+    def initialize(self, otioFile, read=True, useCache=True):
+        """ useCache: if True the edit file is read from the edit files cache when it has not changed since
+            it was last read, and added to it otherwise
+        """
         # wkip release memory from exisiting otio montage???
 
         self.otioFile = otioFile
+        self._rangeTables = dict()
+        self._xmlSideData = None
+        self._useCache = useCache
         if read:
-            self.timeline = ow.get_timeline_from_file(self.otioFile)
+            cachedEdit = None
+            if useCache:
+                cachedEdit = edit_file_cache.get_edit_file_cache().load(self.otioFile)
+
+            if cachedEdit is not None:
+                self.timeline, self._xmlSideData = cachedEdit
+            else:
+                self.timeline = ow.get_timeline_from_file(self.otioFile)
+                if useCache:
+                    edit_file_cache.get_edit_file_cache().store(self.otioFile, self.timeline)
             self._name = self.timeline.name
 
+    def get_clip_range_table(self, clip, rebuild=False):
+        """ Return the range table of the track containing the specified clip and the row of the clip in it
+            Tables are built once per track, on first request
+            rebuild: if True the table is computed again, to use when the track has been modified
+            The row is None if the clip is not in a track or not in the table of its track
+        """
+        track = clip.parent()
+        if track is None:
+            return None, None
+
+        rangeTable = None if rebuild else self._rangeTables.get(id(track))
+        if rangeTable is not None and rangeTable.get_row(clip) is None:
+            # the clip has been added to the track after the table was built
+            rangeTable = None
+        if rangeTable is None:
+            rangeTable = ow.get_track_range_table(track, self.get_fps())
+            self._rangeTables[id(track)] = rangeTable
+        return rangeTable, rangeTable.get_row(clip)
+
+    def refresh_shots(self):
+        """ Compute again the frame values of all the shots, to call when the timeline has been modified
+        """
+        self._rangeTables = dict()
+        for seq in self.get_sequences():
+            for shot in seq.getEditShots():
+                shot._read_range_table(rebuild=False)
+            seq.invalidate_bounds()
+
     def get_montage_type(self):
         return "OTIO"
 
@@ -104,8 +153,21 @@ class MontageOtio(MontageInterface):
             self.sequencesList = list()
         newSeq = SequenceOtio(self)
         self.sequencesList.append(newSeq)
+        self._index_sequence(newSeq)
         return newSeq
 
+    def get_clip_name_from_xml(self, clip):
+        """ When the clip is a nested edit (a Stack) its name in the otio timeline is the name of the nested
+            edit and not the name of the clip in the xml file, which is then found from the clip id
+        """
+        newName = clip.name
+        if "Stack" == type(clip).__name__:
+            if hasattr(clip, "metadata"):
+                if "fcp_xml" in clip.metadata:
+                    if "@id" in clip.metadata["fcp_xml"]:
+                        newName = self.get_xml_clip_name(clip.metadata["fcp_xml"]["@id"], newName)
+        return newName
+
     def getSequenceNameFromMediaName(self, fileName):
         seqName = ""
 
@@ -127,135 +189,25 @@ class MontageOtio(MontageInterface):
             _logger.error("fillMontageInfoFromOtioFile: self.timeline is None!")
             return
 
-        def _getParentSeqIndex(seqList, seqName):
-            #    print("\n_getParentSeqIndex: seqName: ", seqName)
-            for i, seq in enumerate(seqList):
-                if seqName in seq.get_name().lower():
-                    #    print(f"    : {seq.name}, i: {i}")
-                    return i
-
-            return -1
-
-        def _getVideoCharacteristicsFromXML(xmlDom):
-            #    print("_getVideoCharacteristicsFromXML")
-
-            # from xml.dom.minidom import parse
-            # xmlDom = parse(self.otioFile)
-
-            seq = xmlDom.getElementsByTagName("sequence")[0]
-
-            seqCharacteristics = dict()
-
-            seqDuration = utils_xml.getFirstChildWithName(seq, "duration")
-            if seqDuration is not None:
-                seqCharacteristics = {"duration": int(seqDuration.childNodes[0].nodeValue)}
-            # seqRate = utils_xml.getFirstChildWithName(seq, "rate")
-            # if seqRate is not None:
-            #     seqRateDict = {
-            #         "timebase": float(utils_xml.getFirstChildWithName(seqRate, "timebase").childNodes[0].nodeValue),
-            #         "ntsc": utils_xml.getFirstChildWithName(seqRate, "ntsc").childNodes[0].nodeValue,
-            #     }
-            #     self.seqCharacteristics = {"rate": seqRateDict}
-
-            seqMedia = None
-            seqMediaVideo = None
-            seqMediaVideoFormat = None
-            videoSampleCharacteristics = None
-
-            videoCharacteristics = dict()
-
-            seqMedia = utils_xml.getFirstChildWithName(seq, "media")
-            if seqMedia is not None:
-                seqMediaVideo = utils_xml.getFirstChildWithName(seqMedia, "video")
-
-            if seqMediaVideo is not None:
-                seqMediaVideoFormat = utils_xml.getFirstChildWithName(seqMediaVideo, "format")
-
-            if seqMediaVideoFormat is not None:
-                videoSampleCharacteristics = utils_xml.getFirstChildWithName(
-                    seqMediaVideoFormat, "samplecharacteristics"
-                )
-
-            #    print(f"videoSampleCharacteristics: {videoSampleCharacteristics}")
-
-            if videoSampleCharacteristics is not None:
-                seqRate = utils_xml.getFirstChildWithName(videoSampleCharacteristics, "rate")
-
-                seqRateDict = {
-                    "timebase": float(utils_xml.getFirstChildWithName(seqRate, "timebase").childNodes[0].nodeValue),
-                    "ntsc": utils_xml.getFirstChildWithName(seqRate, "ntsc").childNodes[0].nodeValue,
-                }
-
-                videoCharacteristics["rate"] = seqRateDict
-                videoCharacteristics["width"] = int(
-                    utils_xml.getFirstChildWithName(videoSampleCharacteristics, "width").childNodes[0].nodeValue
-                )
-                videoCharacteristics["height"] = int(
-                    utils_xml.getFirstChildWithName(videoSampleCharacteristics, "height").childNodes[0].nodeValue
-                )
-                # videoCharacteristics["anamorphic"] = (
-                #     utils_xml.getFirstChildWithName(videoSampleCharacteristics, "anamorphic").childNodes[0].nodeValue
-                # )
-                # videoCharacteristics["pixelaspectratio"] = (
-                #     utils_xml.getFirstChildWithName(videoSampleCharacteristics, "pixelaspectratio").childNodes[0].nodeValue
-                # )
-                # videoCharacteristics["fielddominance"] = (
-                #     utils_xml.getFirstChildWithName(videoSampleCharacteristics, "fielddominance").childNodes[0].nodeValue
-                # )
-                # videoCharacteristics["colordepth"] = int(
-                #     utils_xml.getFirstChildWithName(videoSampleCharacteristics, "colordepth").childNodes[0].nodeValue
-                # )
-                # videoCharacteristics["width"] = elem.nodeValue
-                # print(f"width: {videoCharacteristics['width']}")
-                # print(f"videoCharacteristics: {videoCharacteristics}")
+        if self._xmlSideData is None and ".xml" == (Path(self.otioFile).suffix).lower():
+            self._xmlSideData = utils_xml.getFcpXmlSideData(self.otioFile)
+            if self._useCache:
+                edit_file_cache.get_edit_file_cache().store_side_data(self.otioFile, self._xmlSideData)
 
+        if self._xmlSideData is not None:
+            videoCharacteristics = self._xmlSideData["videoCharacteristics"]
+            if "width" in videoCharacteristics:
                 self.set_montage_characteristics(
                     #  videoCharacteristics["rate"]["timebase"],
                     resolution_x=videoCharacteristics["width"],
                     resolution_y=videoCharacteristics["height"],
                     #  duration=seqCharacteristics["duration"],
                 )
+            self.set_xml_clip_names(self._xmlSideData["xmlClipNames"])
+        else:
+            self.set_xml_clip_names(dict())
 
-            return ()
-
-        def _getXmlClipNames(xmlDom):
-
-            # from xml.dom.minidom import parse
-            # xmlDom = parse(self.parent.parent.otioFile)
-
-            xmlClipNamesArr = []
-
-            clipItems = xmlDom.getElementsByTagName("clipitem")
-            for item in clipItems:
-                nameItem = item.getElementsByTagName("name")[0]
-                xmlClipNamesArr.append((item.getAttribute("id"), nameItem.childNodes[0].nodeValue))
-
-            return xmlClipNamesArr
-
-        def _get_name_from_xml_clip_name(clip, xmlClipNames):
-            newName = clip.name
-            if "Stack" == type(clip).__name__:
-                if hasattr(clip, "metadata"):
-                    if "fcp_xml" in clip.metadata:
-                        if "@id" in clip.metadata["fcp_xml"]:
-                            clipId = clip.metadata["fcp_xml"]["@id"]
-                            for item in xmlClipNames:
-                                if item[0] == clipId:
-                                    # self.name = item[1]
-                                    newName = item[1]
-                                    break
-            return newName
-
-        xmlClipNames = []
-        if ".xml" == (Path(self.otioFile).suffix).lower():
-            from xml.dom.minidom import parse
-
-            xmlDom = parse(self.otioFile)
-            _getVideoCharacteristicsFromXML(xmlDom)
-            xmlClipNames = _getXmlClipNames(xmlDom)
-
-        self.sequencesList = None
-        self.sequencesList = list()
+        self.clear_sequences()
 
         _logger.debug(f"refVideoTrackInd: {refVideoTrackInd}")
         # ref track is the first one
@@ -297,22 +249,18 @@ class MontageOtio(MontageInterface):
 
                             media_name_splited = media_name_lower.split("_")
                             if 2 <= len(media_name_splited):
-                                parentSeqInd = _getParentSeqIndex(self.sequencesList, media_name_splited[1])
+                                newSeq = self.get_sequence_by_key(media_name_splited[1])
 
                                 # add new seq if not found
-                                newSeq = None
-                                if -1 == parentSeqInd:
+                                if newSeq is None:
                                     newSeq = self.newSequence()
                                     newSeq.set_name(self.getSequenceNameFromMediaName(media_name))
-
-                                else:
-                                    newSeq = self.sequencesList[parentSeqInd]
                                 newSeq.newShot(clip)
 
                     # clip can be a nested edit (called a stack)
                     else:
                         # stackName = clip.name
-                        stackName = _get_name_from_xml_clip_name(clip, xmlClipNames)
+                        stackName = self.get_clip_name_from_xml(clip)
                         #  if config.devDebug:
                         # print(f"\n** clip: {clip.name}")
                         # print(f"Stack Seq Name: {stackName}, seq: {self.getSequenceNameFromMediaName(stackName)}")
@@ -324,20 +272,15 @@ class MontageOtio(MontageInterface):
                             media_name_splited = (stackName.lower()).split("_")
                             # print(f"media_name_splited: {media_name_splited}")
                             if 2 <= len(media_name_splited):
-                                parentSeqInd = _getParentSeqIndex(self.sequencesList, media_name_splited[1])
+                                newSeq = self.get_sequence_by_key(media_name_splited[1])
 
                                 # add new seq if not found
-                                newSeq = None
                                 #   print(f"   Stack Seq Name: {self.getSequenceNameFromMediaName(stackName)}")
-
-                                if -1 == parentSeqInd:
+                                if newSeq is None:
                                     newSeq = self.newSequence()
                                     newSeq.set_name(self.getSequenceNameFromMediaName(stackName))
-                                else:
-                                    newSeq = self.sequencesList[parentSeqInd]
                                 newClip = newSeq.newShot(clip)
                                 newClip.name = stackName
-                                # newClip.set_name_from_xml_clip_name(xmlClipNames)
                         # else:
                         # wkip debug otio import
 
@@ -380,7 +323,7 @@ class SequenceOtio(SequenceInterface):
         if self.shotsList is None:
             self.shotsList = list()
         newShot = ShotOtio(self, shot)
-        self.shotsList.append(newShot)
+        self._appendShot(newShot)
         return newShot
 
 
@@ -388,6 +331,8 @@ class ShotOtio(ShotInterface):
     """ 
     """
 
+    __slots__ = ("clip", "soundClips", "name")
+
     def __init__(self, parent, shot):
         super().__init__()
 
@@ -402,7 +347,37 @@ class ShotOtio(ShotInterface):
         # several clips. Otio works like this so the real clip name has to be set afterwards by reading the xml file.
         self.name = self.clip.name
 
-        pass
+        self._read_range_table(rebuild=False)
+
+    def _read_range_table(self, rebuild):
+        rangeTable, row = self.parent.parent.get_clip_range_table(self.clip, rebuild=rebuild)
+        if row is None:
+            # the values are computed from the clip itself
+            fps = self.parent.parent.get_fps()
+            self._frame_start = ow.get_clip_frame_start(self.clip, fps)
+            self._frame_end = ow.get_clip_frame_end(self.clip, fps)
+            self._frame_duration = ow.get_clip_frame_duration(self.clip, fps)
+            self._frame_final_start = ow.get_clip_frame_final_start(self.clip, fps)
+            self._frame_final_end = ow.get_clip_frame_final_end(self.clip, fps)
+            self._frame_final_duration = ow.get_clip_frame_final_duration(self.clip, fps)
+            self._frame_offset_start = ow.get_clip_frame_offset_start(self.clip, fps)
+            self._frame_offset_end = ow.get_clip_frame_offset_end(self.clip, fps)
+            return
+
+        self._frame_start = rangeTable.frame_start[row]
+        self._frame_end = rangeTable.frame_end[row]
+        self._frame_duration = rangeTable.frame_duration[row]
+        self._frame_final_start = rangeTable.frame_final_start[row]
+        self._frame_final_end = rangeTable.frame_final_end[row]
+        self._frame_final_duration = rangeTable.frame_final_duration[row]
+        self._frame_offset_start = rangeTable.frame_offset_start[row]
+        self._frame_offset_end = rangeTable.frame_offset_end[row]
+
+    def refresh(self):
+        """ Compute the frame values again from the otio clip, to call when the clip or its track have changed
+        """
+        self._read_range_table(rebuild=True)
+        self.parent.invalidate_bounds()
 
     def get_name(self):
         return self.name
@@ -519,34 +494,6 @@ class ShotOtio(ShotInterface):
 
         return clipType
 
-    def get_frame_start(self):
-        return ow.get_clip_frame_start(self.clip, self.parent.parent.get_fps())
-
-    def get_frame_end(self):
-        """get_frame_end is exclusive in order to follow the Blender implementation of get_frame_end for its clips
-        """
-        # get_clip_frame_end is exclusive
-        return ow.get_clip_frame_end(self.clip, self.parent.parent.get_fps())
-
-    def get_frame_duration(self):
-        return ow.get_clip_frame_duration(self.clip, self.parent.parent.get_fps())
-
-    def get_frame_final_start(self):
-        return ow.get_clip_frame_final_start(self.clip, self.parent.parent.get_fps())
-
-    def get_frame_final_end(self):
-        # get_clip_frame_final_end is exclusive
-        return ow.get_clip_frame_final_end(self.clip, self.parent.parent.get_fps())
-
-    def get_frame_final_duration(self):
-        return ow.get_clip_frame_final_duration(self.clip, self.parent.parent.get_fps())
-
-    def get_frame_offset_start(self):
-        return ow.get_clip_frame_offset_start(self.clip, self.parent.parent.get_fps())
-
-    def get_frame_offset_end(self):
-        return ow.get_clip_frame_offset_end(self.clip, self.parent.parent.get_fps())
-
     def get_media_soundfiles(self):
         sounds = []
         sounds.append("c:\\toto.mp3")
@@ -28,6 +28,9 @@ import re
 import math
 
 from ..utils import utils
+from ..utils import utils_os
+
+from .track_range_table import get_track_range_table
 
 from ..config import sm_logging
 
@@ -119,11 +122,14 @@ def get_timeline_from_file(otioFile):
     return opentimelineio.adapters.read_from_file(otioFile)
 
 
-def parseTrack(timeline, track_type, track_index):
+def parseTrack(timeline, track_type, track_index, alternative_media_folder="", media_resolver=None):
     """ Display the track information
         track_type can be "VIDEO" or "AUDIO"
+        Media not found at their path are looked for by name in alternative_media_folder
     """
     # timeline = opentimelineio.adapters.read_from_file(otioFile)
+    if media_resolver is None:
+        media_resolver = utils_os.MediaResolver()
 
     def _parseTrack(track):
 
@@ -141,16 +147,12 @@ def parseTrack(timeline, track_type, track_index):
             print(f"{tab2}clip.media_reference.target_url: {clip.media_reference.target_url}")
             media_path = Path(get_clip_media_path(clip))
             print(f"{tab2}media_path: {media_path}")
-            if not media_path.exists():
-                # Lets find it inside next to the xml
-                media_path = Path(otioFile).parent.joinpath(media_path.name)
-                print(f"{tab2}   ** media not found, so Path(self.otioFile).parent: {Path(otioFile).parent}")
-                print(f"{tab2}      and new media_path: {media_path}")
-
-            if media_path.exists():
-                media_path = str(media_path)
-            else:
+            resolved_path = media_resolver.resolve(media_path, search_roots=[alternative_media_folder])
+            if resolved_path is None:
                 print("   Media not found")
+            elif resolved_path != str(media_path):
+                print(f"{tab2}   ** media not found, so alternative_media_folder: {alternative_media_folder}")
+                print(f"{tab2}      and new media_path: {resolved_path}")
 
     #####
     #####
@@ -176,19 +178,29 @@ def get_media_occurence(timeline, media_name, track_type="ALL", last_occurence=F
         track_type can be "ALL", "VIDEO" or "AUDIO"
     """
     found_clip = None
+    found_start = None
+    found_end = None
     tab = "   "
+    fps = timeline.duration().rate
 
+    # each occurence is returned as a tuple (clip, frame final start, end inclusive, end exclusive)
     def _get_media_first_occurence(tracks):
         first_c = None
         ind = -1
         for track in tracks:
-            for i, clip in enumerate(track.each_clip()):
+            rangeTable = get_track_range_table(track, fps, nested_clips=True)
+            for i, clip in enumerate(rangeTable.clips):
                 ind += 1
 
                 clip_name_l = clip.name.lower()
                 if media_name_l in clip_name_l:
-                    if first_c is None or get_clip_frame_final_start(clip) < get_clip_frame_final_start(first_c):
-                        first_c = clip
+                    if first_c is None or rangeTable.frame_final_start[i] < first_c[1]:
+                        first_c = (
+                            clip,
+                            rangeTable.frame_final_start[i],
+                            rangeTable.end_inclusive[i],
+                            rangeTable.end_exclusive[i],
+                        )
                         print(f"\n{tab}Clip: {ind}, {clip.name}")
                         break
 
@@ -198,15 +210,19 @@ def get_media_occurence(timeline, media_name, track_type="ALL", last_occurence=F
         last_c = None
         ind = -1
         for track in tracks:
-            for i, clip in enumerate(track.each_clip()):
+            rangeTable = get_track_range_table(track, fps, nested_clips=True)
+            for i, clip in enumerate(rangeTable.clips):
                 ind += 1
 
                 clip_name_l = clip.name.lower()
                 if media_name_l in clip_name_l:
-                    if last_c is None or get_timeline_clip_end_inclusive(clip) > get_timeline_clip_end_inclusive(
-                        last_c
-                    ):
-                        last_c = clip
+                    if last_c is None or rangeTable.end_inclusive[i] > last_c[2]:
+                        last_c = (
+                            clip,
+                            rangeTable.frame_final_start[i],
+                            rangeTable.end_inclusive[i],
+                            rangeTable.end_exclusive[i],
+                        )
                         print(f"\n{tab}Clip: {ind}, {clip.name}")
                         break
 
@@ -214,30 +230,32 @@ def get_media_occurence(timeline, media_name, track_type="ALL", last_occurence=F
 
     media_name_l = media_name.lower()
 
+    found_occurence = None
     if "ALL" == track_type or "VIDEO" == track_type:
         tracks = timeline.video_tracks()
         if last_occurence:
-            found_clip = _get_media_last_occurence(tracks)
+            found_occurence = _get_media_last_occurence(tracks)
         else:
-            found_clip = _get_media_first_occurence(tracks)
+            found_occurence = _get_media_first_occurence(tracks)
 
     if "ALL" == track_type or "AUDIO" == track_type:
         tracks = timeline.audio_tracks()
-        found_audio_clip = None
+        found_audio_occurence = None
         if last_occurence:
-            found_audio_clip = _get_media_last_occurence(tracks)
+            found_audio_occurence = _get_media_last_occurence(tracks)
         else:
-            found_audio_clip = _get_media_first_occurence(tracks)
+            found_audio_occurence = _get_media_first_occurence(tracks)
 
-        if found_clip is None:
-            found_clip = found_audio_clip
-        elif found_audio_clip is None:
+        if found_occurence is None:
+            found_occurence = found_audio_occurence
+        elif found_audio_occurence is None:
             pass
         else:
-            first_clip_start = get_clip_frame_final_start(found_clip)
-            first_audio_clip_start = get_clip_frame_final_start(found_audio_clip)
-            if first_audio_clip_start < first_clip_start:
-                found_clip = found_audio_clip
+            if found_audio_occurence[1] < found_occurence[1]:
+                found_occurence = found_audio_occurence
+
+    if found_occurence is not None:
+        found_clip, found_start, _, found_end = found_occurence
 
     # print result
     print("\n Track Type: ", track_type)
@@ -245,9 +263,7 @@ def get_media_occurence(timeline, media_name, track_type="ALL", last_occurence=F
     if found_clip is None:
         print("   No clip found")
     else:
-        start = get_clip_frame_final_start(found_clip)
-        end = get_timeline_clip_end_exclusive(found_clip)
-        print(f"   Found clip: {found_clip.name}, start: {start}, end: {end}")
+        print(f"   Found clip: {found_clip.name}, start: {found_start}, end: {found_end}")
 
     return found_clip
 
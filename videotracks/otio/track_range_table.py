@@ -0,0 +1,110 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Frame values of the clips of otio tracks, computed without Blender
+"""
+
+import math
+
+import opentimelineio
+
+
+class TrackRangeTable:
+    """ Frame values of all the clips of a track, computed in a single pass with track.range_of_all_children()
+        instead of calling clip.range_in_parent() (which walks all the previous siblings) for every value.
+        Values are stored in flat lists of integers, one row per clip, in the order of the track.
+        Values are the same as the ones returned by the otio_wrapper.get_clip_frame_* functions.
+        If nested_clips is False the rows are the direct children of the track (clips and stacks, gaps and
+        transitions are skipped), otherwise they are the media clips returned by track.each_clip()
+    """
+
+    def __init__(self, track, fps, nested_clips=False):
+        self.fps = fps
+        self.clips = list()
+        self._rows = dict()
+
+        self.frame_start = list()
+        self.frame_end = list()
+        self.frame_final_start = list()
+        self.frame_final_end = list()
+        self.frame_offset_start = list()
+        self.frame_offset_end = list()
+        self.frame_duration = list()
+        self.frame_final_duration = list()
+        self.end_inclusive = list()
+        self.end_exclusive = list()
+
+        self._fillTable(track, nested_clips)
+
+    def __len__(self):
+        return len(self.clips)
+
+    def _fillTable(self, composition, nested_clips):
+        ranges = composition.range_of_all_children()
+        for child in composition:
+            if isinstance(child, opentimelineio.schema.Clip):
+                self._addRow(child, ranges[child])
+            elif isinstance(child, opentimelineio.core.Composition):
+                if nested_clips:
+                    self._fillTable(child, nested_clips)
+                else:
+                    self._addRow(child, ranges[child])
+
+    def _addRow(self, clip, range_in_parent):
+        fps = self.fps
+        available_range = clip.available_range()
+        source_start = clip.source_range.start_time.value
+
+        frame_final_start = opentimelineio.opentime.to_frames(range_in_parent.start_time)
+        frame_final_duration = int(math.ceil(opentimelineio.opentime.to_frames(range_in_parent.duration)))
+        frame_final_end = frame_final_start + frame_final_duration
+
+        clipEmptyDuration = int(round(available_range.start_time.value_rescaled_to(fps)))
+        frame_start = frame_final_start - int(round(source_start)) + clipEmptyDuration
+        frame_duration = int(math.ceil(available_range.duration.value_rescaled_to(fps)))
+        frame_end = frame_start + frame_duration
+
+        self._rows[id(clip)] = len(self.clips)
+        self.clips.append(clip)
+        self.frame_start.append(frame_start)
+        self.frame_end.append(frame_end)
+        self.frame_final_start.append(frame_final_start)
+        self.frame_final_end.append(frame_final_end)
+        self.frame_offset_start.append(
+            int(math.ceil(source_start)) - int(math.ceil(available_range.start_time.value_rescaled_to(fps)))
+        )
+        self.frame_offset_end.append(frame_end - frame_final_end)
+        self.frame_duration.append(frame_duration)
+        self.frame_final_duration.append(frame_final_duration)
+        self.end_inclusive.append(opentimelineio.opentime.to_frames(range_in_parent.end_time_inclusive()))
+        self.end_exclusive.append(opentimelineio.opentime.to_frames(range_in_parent.end_time_exclusive()))
+
+    def get_row(self, clip):
+        """ Return the row of the clip in the table, None if the clip is not in the table
+        """
+        return self._rows.get(id(clip))
+
+
+def get_track_range_table(track, fps, nested_clips=False):
+    """ Return the range table of the specified track
+        See TrackRangeTable
+    """
+    return TrackRangeTable(track, fps, nested_clips=nested_clips)
+
+
+# ----------------------------------
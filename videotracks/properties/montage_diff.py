@@ -0,0 +1,200 @@
+# GPLv3 License
+#
+# Copyright (C) 2021 Ubisoft
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Diff between the shots of a reference edit and the shots of a montage, used to compare and conform montages
+"""
+
+from bisect import bisect_left
+from typing import Any, NamedTuple, Tuple
+
+
+# change types
+ADDED = "ADDED"  # the reference shot has no matching shot
+REMOVED = "REMOVED"  # the shot has no matching reference shot
+MOVED = "MOVED"  # the shot is not at the same place relatively to the other matched shots
+RETIMED = "RETIMED"  # the shot and its reference shot have different durations
+ENABLED = "ENABLED"  # the shot is disabled and has to be enabled
+DUPLICATE = "DUPLICATE"  # the key of the reference shot is used by a previous reference shot, index is its match
+
+
+class ShotChange(NamedTuple):
+    """ Changes between a reference shot and its matching shot
+        ref_index and index are the indices of the shots in their respective lists, -1 when there is no shot
+    """
+
+    ref_index: int
+    ref_shot: Any
+    index: int
+    shot: Any
+    key: str
+    changes: Tuple[str, ...] = ()
+
+    def has_change(self, change):
+        return change in self.changes
+
+
+class MontageDiff(NamedTuple):
+    """ matches: one ShotChange per reference shot, in the order of the reference edit
+        removed: the REMOVED shots, in the order of the compared list
+    """
+
+    matches: Tuple[ShotChange, ...] = ()
+    removed: Tuple[ShotChange, ...] = ()
+
+    def get_changes(self, change=None):
+        """ Return the ShotChange items having the specified change, or all the changed items if change is None
+        """
+        return [c for c in self.matches + self.removed if (c.changes if change is None else change in c.changes)]
+
+
+class ShotPositions:
+    """ Current indices of the compared shots while they are moved, one by one, after the conformed shots at the
+        start of their list. The shots not conformed yet keep their relative order after the conformed ones
+        Fenwick tree on the initial indices of the shots not conformed yet, O(log n) per call
+    """
+
+    def __init__(self, numShots):
+        self.numConformed = 0
+        self._tree = [0] * (numShots + 1)
+        for i in range(1, numShots + 1):
+            self._tree[i] += 1
+            parent = i + (i & -i)
+            if parent <= numShots:
+                self._tree[parent] += self._tree[i]
+
+    def get_index(self, index):
+        """ Return the current index of the shot not conformed yet which initial index is specified
+        """
+        currentIndex = self.numConformed
+        i = index
+        while 0 < i:
+            currentIndex += self._tree[i]
+            i -= i & -i
+        return currentIndex
+
+    def conform(self, index=-1):
+        """ Record that the shot which initial index is specified has been moved after the conformed shots
+            index is -1 for a shot which was not in the initial list, such as a new shot
+        """
+        if -1 != index:
+            i = index + 1
+            while i < len(self._tree):
+                self._tree[i] -= 1
+                i += i & -i
+        self.numConformed += 1
+
+
+def _get_longest_increasing_subsequence(values):
+    """ Return the set of the positions, in values, of a longest strictly increasing subsequence
+        Patience sorting, O(n log n)
+    """
+    pileTops = list()
+    pileTopPositions = list()
+    previousPositions = [-1] * len(values)
+
+    for pos, value in enumerate(values):
+        pileInd = bisect_left(pileTops, value)
+        if pileInd:
+            previousPositions[pos] = pileTopPositions[pileInd - 1]
+        if pileInd == len(pileTops):
+            pileTops.append(value)
+            pileTopPositions.append(pos)
+        else:
+            pileTops[pileInd] = value
+            pileTopPositions[pileInd] = pos
+
+    positions = set()
+    pos = pileTopPositions[-1] if pileTopPositions else -1
+    while -1 != pos:
+        positions.add(pos)
+        pos = previousPositions[pos]
+    return positions
+
+
+def _get_shot_duration(shot):
+    return shot.get_frame_final_duration()
+
+
+def _get_shot_enabled(shot):
+    return getattr(shot, "enabled", True)
+
+
+def diffShots(
+    refShots, shots, refKey, key, getRefDuration=_get_shot_duration, getDuration=_get_shot_duration, isEnabled=None
+):
+    """ Return the MontageDiff between the reference shots and the compared shots
+        refKey and key are functions returning the name used to match a reference shot and a compared shot
+        A compared shot matches at most one reference shot, the first one having its key. The next reference
+        shots having this key are DUPLICATE, the other reference shots without matching shot are ADDED
+        isEnabled: function returning the enabled state of a compared shot, its attribute "enabled" if None
+    """
+    if isEnabled is None:
+        isEnabled = _get_shot_enabled
+
+    # first compared shot for each key
+    shotIndices = dict()
+    shotKeys = list()
+    for ind, shot in enumerate(shots):
+        shotKey = key(shot)
+        shotKeys.append(shotKey)
+        shotIndices.setdefault(shotKey, ind)
+
+    refKeys = [refKey(refShot) for refShot in refShots]
+    matchedIndices = list()
+    usedIndices = set()
+    for refShotKey in refKeys:
+        ind = shotIndices.get(refShotKey, -1)
+        if -1 != ind and ind not in usedIndices:
+            usedIndices.add(ind)
+        else:
+            ind = -1
+        matchedIndices.append(ind)
+
+    # the matched shots kept in place are the longest sequence already in the reference order
+    matchedPositions = [pos for pos, ind in enumerate(matchedIndices) if -1 != ind]
+    inPlace = _get_longest_increasing_subsequence([matchedIndices[pos] for pos in matchedPositions])
+    movedPositions = {pos for i, pos in enumerate(matchedPositions) if i not in inPlace}
+
+    matches = list()
+    for refInd, refShot in enumerate(refShots):
+        ind = matchedIndices[refInd]
+        if -1 == ind:
+            ind = shotIndices.get(refKeys[refInd], -1)
+            if -1 == ind:
+                matches.append(ShotChange(refInd, refShot, -1, None, refKeys[refInd], (ADDED,)))
+            else:
+                matches.append(ShotChange(refInd, refShot, ind, shots[ind], refKeys[refInd], (DUPLICATE,)))
+            continue
+
+        shot = shots[ind]
+        changes = list()
+        if refInd in movedPositions:
+            changes.append(MOVED)
+        if getDuration(shot) != getRefDuration(refShot):
+            changes.append(RETIMED)
+        if not isEnabled(shot):
+            changes.append(ENABLED)
+        matches.append(ShotChange(refInd, refShot, ind, shot, shotKeys[ind], tuple(changes)))
+
+    removed = tuple(
+        ShotChange(-1, None, ind, shot, shotKeys[ind], (REMOVED,))
+        for ind, shot in enumerate(shots)
+        if ind not in usedIndices
+    )
+
+    return MontageDiff(matches=tuple(matches), removed=removed)
@@ -21,6 +21,8 @@ Generic montage class used to host the content of an edit
 
 from pathlib import Path
 
+from . import montage_diff
+
 from ..config import sm_logging
 
 _logger = sm_logging.getLogger(__name__)
@@ -35,6 +37,16 @@ class MontageInterface(object):
         self.sequencesList = list()
         self._characteristics = dict()
 
+        # bounds of the montage, maintained by the sequences when shots are added, see get_frame_start()
+        self._frame_start = None
+        self._frame_end = None
+        self._boundsValid = True
+
+        # sequences by normalized name, see get_sequence_key()
+        self._sequencesIndex = dict()
+        # names of the clips of the edit file by clip id, for the clips which name is not kept by otio
+        self._xmlClipNames = dict()
+
     def get_montage_type(self):
         return "INTERFACE"
 
@@ -92,19 +104,46 @@ class MontageInterface(object):
         else:
             return -1
 
-    def get_frame_start(self):
-        if self.sequencesList is not None and len(self.sequencesList):
-            return self.sequencesList[0].get_frame_start()
+    def _extend_bounds(self, start, end):
+        """ Called by the sequences when a shot is added to them
+        """
+        if not self._boundsValid:
+            return
+        if self._frame_start is None:
+            self._frame_start = start
+            self._frame_end = end
         else:
-            return -1
+            self._frame_start = min(self._frame_start, start)
+            self._frame_end = max(self._frame_end, end)
+
+    def invalidate_bounds(self):
+        """ The bounds will be computed again from the sequences on next request
+        """
+        self._boundsValid = False
+
+    def _update_bounds(self):
+        self._frame_start = None
+        self._frame_end = None
+        self._boundsValid = True
+        if self.sequencesList is not None:
+            for seq in self.sequencesList:
+                if len(seq.shotsList):
+                    self._extend_bounds(seq.get_frame_start(), seq.get_frame_end())
+
+    def get_frame_start(self):
+        """ Return the smallest start of the sequences, -1 if there is no shot
+        """
+        if not self._boundsValid:
+            self._update_bounds()
+        return -1 if self._frame_start is None else self._frame_start
 
     def get_frame_end(self):
         """get_frame_end is exclusive in order to follow the Blender implementation of get_frame_end for its clips
+            Return the biggest end of the sequences, -1 if there is no shot
         """
-        if self.sequencesList is not None and len(self.sequencesList):
-            return self.sequencesList[len(self.sequencesList) - 1].get_frame_end()
-        else:
-            return -1
+        if not self._boundsValid:
+            self._update_bounds()
+        return -1 if self._frame_end is None else self._frame_end
 
     def get_frame_duration(self):
         if "duration" in self._characteristics:
@@ -123,19 +162,75 @@ class MontageInterface(object):
             self.sequencesList = list()
         newSeq = SequenceInterface(self)
         self.sequencesList.append(newSeq)
+        self._index_sequence(newSeq)
         return newSeq
 
+    def removeSequence(self, sequence):
+        if sequence in self.sequencesList:
+            self.sequencesList.remove(sequence)
+            sequenceKey = self.get_sequence_key(sequence.get_name())
+            if self._sequencesIndex.get(sequenceKey) is sequence:
+                # index the next sequence with the same key, if any
+                self._index_sequence(sequence, previous_name=sequence.get_name())
+                if self._sequencesIndex.get(sequenceKey) is sequence:
+                    del self._sequencesIndex[sequenceKey]
+            self.invalidate_bounds()
+
+    def clear_sequences(self):
+        self.sequencesList = list()
+        self._sequencesIndex = dict()
+        self._frame_start = None
+        self._frame_end = None
+        self._boundsValid = True
+
+    @staticmethod
+    def get_sequence_key(sequence_name):
+        """ Return the normalized name used to index the sequences
+        """
+        return sequence_name.strip().lower()
+
+    def _index_sequence(self, sequence, previous_name=None):
+        """ Update the index of the sequences when a sequence is added or renamed
+        """
+        if previous_name is not None:
+            previousKey = self.get_sequence_key(previous_name)
+            if self._sequencesIndex.get(previousKey) is sequence:
+                del self._sequencesIndex[previousKey]
+                # another sequence may have the same key
+                for seq in self.sequencesList:
+                    if seq is not sequence and self.get_sequence_key(seq.get_name()) == previousKey:
+                        self._sequencesIndex[previousKey] = seq
+                        break
+        # when several sequences have the same key the first one is kept
+        self._sequencesIndex.setdefault(self.get_sequence_key(sequence.get_name()), sequence)
+
+    def get_sequence_by_key(self, sequence_name):
+        """ Return the sequence which normalized name is the one of sequence_name, None if not found
+        """
+        return self._sequencesIndex.get(self.get_sequence_key(sequence_name))
+
     def get_sequence_by_name(self, sequence_name):
-        refSeq = None
-
-        sequences = self.get_sequences()
-        for seq in sequences:
-            #  print(f"seq: {seq}, sequence_name: {sequence_name}")
-            if seq.get_name() == sequence_name:
-                refSeq = seq
-                break
+        refSeq = self.get_sequence_by_key(sequence_name)
+
+        # the indexed sequence may have a name differing only by its case
+        if refSeq is not None and refSeq.get_name() != sequence_name:
+            refSeq = None
+            sequences = self.get_sequences()
+            for seq in sequences:
+                #  print(f"seq: {seq}, sequence_name: {sequence_name}")
+                if seq.get_name() == sequence_name:
+                    refSeq = seq
+                    break
         return refSeq
 
+    def set_xml_clip_names(self, xmlClipNames):
+        """ xmlClipNames: dictionary of the clip names by clip id
+        """
+        self._xmlClipNames = dict(xmlClipNames)
+
+    def get_xml_clip_name(self, clipId, default=None):
+        return self._xmlClipNames.get(clipId, default)
+
     def conformToRefMontage(self, ref_montage, ref_sequence_name=""):
         WARNING = "\033[93m"
         ENDC = "\033[0m"
@@ -188,58 +283,54 @@ class MontageInterface(object):
         ###################
 
         comparedShotsList = selfSeq.getEditShots(ignoreDisabled=False)
-        newEditShots = list()
-        numShotsInRefEdit = len(refSeq.getEditShots())
-        for i, shot in enumerate(refSeq.getEditShots()):
-            shotRef = shot
+        montageDiff = montage_diff.diffShots(
+            refSeq.getEditShots(),
+            comparedShotsList,
+            refKey=lambda shotRef: Path(shotRef.get_name()).stem,
+            key=lambda sh: sh.get_name(),
+        )
+
+        for shotChange in montageDiff.matches:
+            shotRef = shotChange.ref_shot
             textRef = shotRef.get_name()
-            shotRefName = Path(shotRef.get_name()).stem
-
-            shotSelf = None
-            for sh in comparedShotsList:
-                # if sh.get_name() == shotRef.get_name():
-                shotName = sh.get_name()
-                # print(f"shotName: {shotName}, shotRefName: {shotRefName}")
-                if shotName == shotRefName:
-                    shotSelf = sh
-                    newEditShots.append(shotSelf)
-                    break
+            shotSelf = shotChange.shot
 
             if shotSelf is None:
                 textSelf = "** Not found **"
+            elif shotChange.has_change(montage_diff.DUPLICATE):
+                textSelf = f"** Already used by a previous ref shot: {shotSelf.get_name()} **"
             else:
                 textSelf = shotSelf.get_name()
                 textSelf += "   "
 
-                if shotSelf.get_frame_final_duration() != shotRef.get_frame_final_duration():
+                if shotChange.has_change(montage_diff.MOVED):
+                    textSelf += " / to move"
+
+                if shotChange.has_change(montage_diff.RETIMED):
                     textSelf += f" / different durations ({shotSelf.get_frame_final_duration()} fr.)"
 
                 # wkip we don't know the length of the handles!!!
                 # if shotSelf.get_frame_offset_start() != shotRef.get_frame_final_duration():
                 #     textSelf += f" / different durations ({shotSelf.get_frame_final_duration()} fr.)"
 
-                if not shotSelf.enabled:
+                if shotChange.has_change(montage_diff.ENABLED):
                     textSelf += " / to enable"
 
-            # wkip wkip here mettre les diffs
-
-            printInfoLine(str(i), f"{textRef}  ({shotRef.get_frame_final_duration()} fr.)", textSelf)
-        # print(f"Shot: {shot.get_name()}")
-        #         pass
+            printInfoLine(
+                str(shotChange.ref_index), f"{textRef}  ({shotRef.get_frame_final_duration()} fr.)", textSelf
+            )
 
         ###################
         # list other shots and disabled them
         ###################
         print("\n\n       Shots not used in current sequence (set to disabled):")
-        ind = 0
-        for i, sh in enumerate(comparedShotsList):
-            if sh not in newEditShots:
-                # sh.enabled = False
-                textSelf = sh.get_name() + " / to disable"
-                printInfoLine(str(ind + numShotsInRefEdit), "-", textSelf)
-                ind += 1
-
-        if 0 == ind:
+        numShotsInRefEdit = len(montageDiff.matches)
+        for ind, shotChange in enumerate(montageDiff.removed):
+            # sh.enabled = False
+            textSelf = shotChange.shot.get_name() + " / to disable"
+            printInfoLine(str(ind + numShotsInRefEdit), "-", textSelf)
+
+        if not len(montageDiff.removed):
             printInfoLine("", "-", "-")
 
         print("")
@@ -255,24 +346,69 @@ class SequenceInterface(object):
 
         self._name = ""
         self.shotsList = list()
+
+        # bounds of the shots, maintained when shots are added, see get_frame_start()
         self.start = -1
         self.end = -1
+        self._boundsValid = True
 
     def get_name(self):
         return self._name
 
     def set_name(self, name):
+        previousName = self._name
         self._name = name
+        if self.parent is not None:
+            self.parent._index_sequence(self, previous_name=previousName)
 
     def newShot(self, shot):
-        if self.shotsList is None:
-            self.shotsList = list()
         newShot = ShotInterface()
         # newShot = ShotInterface(self)
-        self.initialize(self)
-        self.shotsList.append(newShot)
+        newShot.initialize(self)
+        self._appendShot(newShot)
         return newShot
 
+    def _appendShot(self, newShot):
+        """ Add the shot to the list and extend the bounds of the sequence and of the montage with its range
+        """
+        if self.shotsList is None:
+            self.shotsList = list()
+        self.shotsList.append(newShot)
+
+        if self._boundsValid:
+            shotStart = newShot.get_frame_final_start()
+            shotEnd = newShot.get_frame_final_end()
+            if 1 == len(self.shotsList):
+                self.start = shotStart
+                self.end = shotEnd
+            else:
+                self.start = min(self.start, shotStart)
+                self.end = max(self.end, shotEnd)
+            if self.parent is not None:
+                self.parent._extend_bounds(shotStart, shotEnd)
+
+    def removeShot(self, shot):
+        if shot in self.shotsList:
+            self.shotsList.remove(shot)
+            self.invalidate_bounds()
+
+    def invalidate_bounds(self):
+        """ To call when shots are removed or modified. The bounds of the sequence and of the montage will be
+            computed again on next request
+        """
+        self._boundsValid = False
+        if self.parent is not None:
+            self.parent.invalidate_bounds()
+
+    def _update_bounds(self):
+        self.start = -1
+        self.end = -1
+        self._boundsValid = True
+        if len(self.shotsList):
+            # warning: clips may not be on the same track, hence they may not be ordered!!
+            self.start = min(shot.get_frame_final_start() for shot in self.shotsList)
+            self.end = max(shot.get_frame_final_end() for shot in self.shotsList)
+
     # use getEditShots
     # def get_shots(self, ignoreDisabled=True):
     #     return self.getEditShots(ignoreDisabled=ignoreDisabled)
@@ -306,39 +442,51 @@ class SequenceInterface(object):
             return -1
 
     def get_frame_start(self):
-        # warning: clips may not be on the same track, hence they may not be ordered!!
-        start = self.shotsList[0].get_frame_final_start()
-        for shot in self.shotsList:
-            tmpStart = shot.get_frame_final_start()
-            if tmpStart < start:
-                start = tmpStart
-        return start
+        if not self._boundsValid:
+            self._update_bounds()
+        return self.start
 
     def get_frame_end(self):
         """get_frame_end is exclusive in order to follow the Blender implementation of get_frame_end for its clips
         """
-        # warning: clips may not be on the same track, hence they may not be ordered!!
-        end = self.shotsList[0].get_frame_final_end()
-        for shot in self.shotsList:
-            tmpEnd = shot.get_frame_final_end()
-            if tmpEnd > end:
-                end = tmpEnd
-        return end
+        if not self._boundsValid:
+            self._update_bounds()
+        return self.end
 
     def get_frame_duration(self):
         return self.get_frame_end() - self.get_frame_start()
 
 
 class ShotInterface(object):
-    """ 
+    """ The frame values of the shot are computed once, when the shot is created, and stored in slots.
+        Call refresh() when the clip of the shot is modified
     """
 
+    __slots__ = (
+        "parent",
+        "_frame_start",
+        "_frame_end",
+        "_frame_duration",
+        "_frame_final_start",
+        "_frame_final_end",
+        "_frame_final_duration",
+        "_frame_offset_start",
+        "_frame_offset_end",
+    )
+
     def __init__(self):
         # print(" *** self Init in ShotInterface *** ")
         # parent sequence
         self.parent = None
 
-        pass
+        self._frame_start = -1
+        self._frame_end = -1
+        self._frame_duration = -1
+        self._frame_final_start = -1
+        self._frame_final_end = -1
+        self._frame_final_duration = -1
+        self._frame_offset_start = -1
+        self._frame_offset_end = -1
 
     def initialize(self, parent):
         self.parent = parent
@@ -381,28 +529,34 @@ class ShotInterface(object):
 
         return dictShot
 
+    def refresh(self):
+        """ Compute the frame values of the shot from its clip
+            To override in the derived classes
+        """
+        pass
+
     def get_frame_start(self):
-        return -1
+        return self._frame_start
 
     def get_frame_end(self):
         """get_frame_end is exclusive in order to follow the Blender implementation of get_frame_end for its clips
         """
-        return -1
+        return self._frame_end
 
     def get_frame_duration(self):
-        return -1
+        return self._frame_duration
 
     def get_frame_final_start(self):
-        return -1
+        return self._frame_final_start
 
     def get_frame_final_end(self):
-        return -1
+        return self._frame_final_end
 
     def get_frame_final_duration(self):
-        return -1
+        return self._frame_final_duration
 
     def get_frame_offset_start(self):
-        return -1
+        return self._frame_offset_start
 
     def get_frame_offset_end(self):
-        return -1
+        return self._frame_offset_end
@@ -46,6 +46,25 @@ from videotracks.utils import utils_vse
 # ("CUSTOM", "Custom", ""),
 
 
+_trackTypeColors = {
+    "STANDARD": (0.15, 0.06, 0.25, 1),
+    "AUDIO": (0.1, 0.5, 0.2, 1),
+    "VIDEO": (0.1, 0.2, 0.8, 1),
+    "FX": (0.3, 0.03, 0.25, 1),
+    "CAM_FROM_SCENE": (0.6, 0.5, 0.0, 1),
+    "SHOT_CAMERAS": (0.6, 0.2, 0.0, 1),
+    "RENDERED_SHOTS": (0.4, 0.7, 0.0, 1),
+    "CAM_BG": (0.7, 0.0, 0.2, 1),
+    "CUSTOM": (0.3, 0.5, 0.4, 1),
+}
+
+
+def getColorFromTrackType(trackType):
+    """ Return the default color of the tracks of the specified type, None if the type has no default color
+    """
+    return _trackTypeColors.get(trackType)
+
+
 class UAS_VideoTracks_Track(PropertyGroup):
 
     parentScene: PointerProperty(type=Scene, description="Scene to which this track belongs to")
@@ -241,62 +260,63 @@ class UAS_VideoTracks_Track(PropertyGroup):
         trackScene_resolution_x = self.shotManagerScene.render.resolution_x
         trackScene_resolution_y = self.shotManagerScene.render.resolution_y
 
-        self.clearContent()
-
-        if "SHOT_CAMERAS" == self.trackType:
-            for shot in shotsList:
-                print("\nShot:", shot.name)
-                print(f"Start: {shot.start}, Edit Start: {shot.getEditStart()}")
-                newClip = vse_render.createNewClip(
-                    self.parentScene,
-                    "",
-                    self.vseTrackIndex,
-                    -1 * shot.start + shot.getEditStart(),
-                    offsetStart=shot.start,  # + shot.getEditStart(),
-                    offsetEnd=shot.end,
-                    cameraScene=self.shotManagerScene,
-                    cameraObject=shot.camera,
-                    clipName=shot.name,
-                )
-
-                res_x = 1280
-                res_y = 960
-                clip_x = trackScene_resolution_x
-                clip_y = trackScene_resolution_y
-                vse_render.cropClipToCanvas(
-                    res_x, res_y, newClip, clip_x, clip_y, mode="FIT_WIDTH",
-                )
-                # newClip.use_crop = True
-                # newClip.crop.min_x = -1 * int((1280 - trackScene_resolution_x) / 2)
-                # newClip.crop.max_x = newClip.crop.min_x
-                # newClip.crop.min_y = -1 * int((960 - trackScene_resolution_y) / 2)
-                # newClip.crop.max_y = newClip.crop.min_y
-
-        elif "CAM_BG" == self.trackType:
-            for shot in shotsList:
-                print("\nShot:", shot.name)
-
-                if len(shot.camera.data.background_images):
-                    print("Cam BG found")
-                    clip = shot.camera.data.background_images[0].clip
-                    offsetEnd = clip.frame_duration + shot.bgImages_offset - shot.getDuration()
-                    print("OffsetEnd:", offsetEnd)
-                    print(
-                        f"dur: {clip.frame_duration}, off: {shot.bgImages_offset}, end - start:{shot.end - shot.start}"
-                    )
-                    mediaPath = bpy.path.abspath(clip.filepath)
-                    print(f"mediaPath: {mediaPath}, duration: {clip.frame_duration}")
-                    bpy.context.window_manager.UAS_vse_render.createNewClip(
+        with utils_vse.vse_batch(self.parentScene):
+            self.clearContent()
+
+            if "SHOT_CAMERAS" == self.trackType:
+                for shot in shotsList:
+                    print("\nShot:", shot.name)
+                    print(f"Start: {shot.start}, Edit Start: {shot.getEditStart()}")
+                    newClip = vse_render.createNewClip(
                         self.parentScene,
-                        mediaPath,
+                        "",
                         self.vseTrackIndex,
-                        clip.frame_start,
-                        offsetStart=-1 * shot.bgImages_offset,
-                        offsetEnd=offsetEnd,
+                        -1 * shot.start + shot.getEditStart(),
+                        offsetStart=shot.start,  # + shot.getEditStart(),
+                        offsetEnd=shot.end,
+                        cameraScene=self.shotManagerScene,
+                        cameraObject=shot.camera,
+                        clipName=shot.name,
                     )
 
-        elif "RENDERED_SHOTS" == self.trackType:
-            pass
+                    res_x = 1280
+                    res_y = 960
+                    clip_x = trackScene_resolution_x
+                    clip_y = trackScene_resolution_y
+                    vse_render.cropClipToCanvas(
+                        res_x, res_y, newClip, clip_x, clip_y, mode="FIT_WIDTH",
+                    )
+                    # newClip.use_crop = True
+                    # newClip.crop.min_x = -1 * int((1280 - trackScene_resolution_x) / 2)
+                    # newClip.crop.max_x = newClip.crop.min_x
+                    # newClip.crop.min_y = -1 * int((960 - trackScene_resolution_y) / 2)
+                    # newClip.crop.max_y = newClip.crop.min_y
+
+            elif "CAM_BG" == self.trackType:
+                for shot in shotsList:
+                    print("\nShot:", shot.name)
+
+                    if len(shot.camera.data.background_images):
+                        print("Cam BG found")
+                        clip = shot.camera.data.background_images[0].clip
+                        offsetEnd = clip.frame_duration + shot.bgImages_offset - shot.getDuration()
+                        print("OffsetEnd:", offsetEnd)
+                        print(
+                            f"dur: {clip.frame_duration}, off: {shot.bgImages_offset}, end - start:{shot.end - shot.start}"
+                        )
+                        mediaPath = bpy.path.abspath(clip.filepath)
+                        print(f"mediaPath: {mediaPath}, duration: {clip.frame_duration}")
+                        bpy.context.window_manager.UAS_vse_render.createNewClip(
+                            self.parentScene,
+                            mediaPath,
+                            self.vseTrackIndex,
+                            clip.frame_start,
+                            offsetStart=-1 * shot.bgImages_offset,
+                            offsetEnd=offsetEnd,
+                        )
+
+            elif "RENDERED_SHOTS" == self.trackType:
+                pass
 
     def clearContent(self):
         bpy.context.window_manager.UAS_vse_render.clearChannel(self.parentScene, self.vseTrackIndex)
@@ -304,32 +324,36 @@ class UAS_VideoTracks_Track(PropertyGroup):
     # wkip rajouter un range?
     def getClips(self):
         # return bpy.context.window_manager.UAS_vse_render.getChannelClips(self.parentScene, self.vseTrackIndex)
-        return self.parentScene.UAS_video_tracks_props.getChannelClips(self.parentScene, self.vseTrackIndex)
+        return self.parentScene.UAS_video_tracks_props.getChannelClips(self.vseTrackIndex)
 
     def getClipsNumber(self):
         return bpy.context.window_manager.UAS_vse_render.getChannelClipsNumber(self.parentScene, self.vseTrackIndex)
 
+    def get_extent(self):
+        """ Return the tuple (first frame, last frame + 1) of the clips of the track, None if it has no clip
+        """
+        return utils_vse.getChannelIndex(self.parentScene).get_channel_extent(self.vseTrackIndex)
+
+    def find_gaps(self, frameStart=None, frameEnd=None):
+        """ Return the list of the tuples (first frame, last frame + 1) of the empty ranges between the clips
+            See utils_vse.ChannelIndex.find_gaps()
+        """
+        return utils_vse.getChannelIndex(self.parentScene).find_gaps(self.vseTrackIndex, frameStart, frameEnd)
+
+    def find_overlaps(self):
+        return utils_vse.getChannelIndex(self.parentScene).find_overlaps(self.vseTrackIndex)
+
+    def strip_at(self, frame):
+        """ Return the clip of the track at the specified frame, None if there is none
+        """
+        return utils_vse.getChannelIndex(self.parentScene).get_strip_at(self.vseTrackIndex, frame)
+
     def changeClipsTrack(self, targetTrackIndex):
         return bpy.context.window_manager.UAS_vse_render.changeClipsChannel(
             self.parentScene, self.vseTrackIndex, targetTrackIndex
         )
 
     def setColorFromTrackType(self):
-        if "STANDARD" == self.trackType:
-            self.color = (0.15, 0.06, 0.25, 1)
-        elif "AUDIO" == self.trackType:
-            self.color = (0.1, 0.5, 0.2, 1)
-        elif "VIDEO" == self.trackType:
-            self.color = (0.1, 0.2, 0.8, 1)
-        elif "FX" == self.trackType:
-            self.color = (0.3, 0.03, 0.25, 1)
-        elif "CAM_FROM_SCENE" == self.trackType:
-            self.color = (0.6, 0.5, 0.0, 1)
-        elif "SHOT_CAMERAS" == self.trackType:
-            self.color = (0.6, 0.2, 0.0, 1)
-        elif "RENDERED_SHOTS" == self.trackType:
-            self.color = (0.4, 0.7, 0.0, 1)
-        elif "CAM_BG" == self.trackType:
-            self.color = (0.7, 0.0, 0.2, 1)
-        elif "CUSTOM" == self.trackType:
-            self.color = (0.3, 0.5, 0.4, 1)
+        color = getColorFromTrackType(self.trackType)
+        if color is not None:
+            self.color = color
@@ -20,6 +20,7 @@ To do: module description here.
 """
 
 import bpy
+from bpy.app.handlers import persistent
 from bpy.types import Scene
 from bpy.types import PropertyGroup
 from bpy.props import (
@@ -29,9 +30,10 @@ from bpy.props import (
     PointerProperty,
 )
 
-from videotracks.properties.track import UAS_VideoTracks_Track
+from videotracks.properties.track import UAS_VideoTracks_Track, getColorFromTrackType
 
 from videotracks.utils import utils
+from videotracks.utils import utils_handlers
 from videotracks.utils import utils_vse
 
 from videotracks.config import sm_logging
@@ -39,6 +41,16 @@ from videotracks.config import sm_logging
 _logger = sm_logging.getLogger(__name__)
 
 
+# reversed track lists and track indices by track pointer, by props, see VideoTracks_Props._getTracksCache()
+_tracksCaches = dict()
+
+
+@persistent
+def vt_tracksCache_reset(dummy):
+    # the tracks are new python objects after a file load, an undo or a redo
+    _tracksCaches.clear()
+
+
 class VideoTracks_Props(PropertyGroup):
     def version(self):
         """ Return the add-on version in the form of a tupple made by: 
@@ -118,10 +130,11 @@ class VideoTracks_Props(PropertyGroup):
     def _set_numTracks(self, value):
         # new tracks are added at the top
         if value > len(self.tracks):
-            v = value
-            while v > len(self.tracks):
-                atIndex = len(self.tracks) + 1
-                self.addTrack(mode="HEADER", name=f"Track {atIndex}", trackType="STANDARD", atIndex=atIndex)
+            specs = [
+                {"name": f"Track {atIndex}", "trackType": "STANDARD"}
+                for atIndex in range(len(self.tracks) + 1, value + 1)
+            ]
+            self.addTracks(specs)
             self["numTracks"] = value
         else:
             self["numTracks"] = len(self.tracks)
@@ -136,7 +149,7 @@ class VideoTracks_Props(PropertyGroup):
         name="Num Tracks",
         min=0,
         soft_max=20,
-        max=32,
+        max=utils_vse.getMaxNumChannels(),
         get=_get_numTracks,
         set=_set_numTracks,
         update=_update_numTracks,
@@ -218,19 +231,13 @@ class VideoTracks_Props(PropertyGroup):
     # tracks
     ####################
 
-    def getUniqueTrackName(self, nameToMakeUnique):
-        uniqueName = nameToMakeUnique
-
-        trackList = self.getTracks()
-
-        dup_name = False
-        for track in trackList:
-            if uniqueName == track.name:
-                dup_name = True
-        if dup_name:
-            uniqueName = f"{uniqueName}_1"
+    def getTrackNameAllocator(self):
+        """ Return a utils.UniqueNameAllocator initialized with the names of the tracks
+        """
+        return utils.UniqueNameAllocator(t.name for t in self.tracks)
 
-        return uniqueName
+    def getUniqueTrackName(self, nameToMakeUnique):
+        return self.getTrackNameAllocator().allocate(nameToMakeUnique)
 
     def addTrack(
         self,
@@ -278,12 +285,69 @@ class VideoTracks_Props(PropertyGroup):
                 # trackListInverted.move(len(trackList) - 1, len(trackList) - atIndex)
                 trackListInverted.move(len(trackListInverted) - 1, len(trackListInverted) - atIndex)
                 newTrack = trackListInverted[len(trackListInverted) - atIndex]
+            self.invalidateTracksCache()
 
         if "CHANNEL_AND_HEADER" == mode or "CHANNEL" == mode:
             utils_vse.insertChannel(self.parentScene, atIndex)
 
         return newTrack
 
+    def addTracks(self, specs):
+        """ Add the headers of several tracks at once at the top of the track list
+            specs: list of dictionaries, from the lowest to the highest new track, with the optional keys
+            "name", "trackType", "color", "enabled", "sceneName" and "sceneTakeName" used as in addTrack()
+            The names are made unique and the colors are set from the track types before the tracks are created,
+            the update callbacks of the track properties are not called
+            Return the list of the new tracks, in the order of specs
+        """
+        if not len(specs):
+            return []
+
+        parentScene = self.getParentScene()
+        trackListInverted = self.tracks
+        numPreviousTracks = len(trackListInverted)
+
+        trackNames = self.getTrackNameAllocator().allocate_names([spec.get("name", "defaultTrack") for spec in specs])
+
+        # the highest track is the first one in self.tracks
+        for spec, name in zip(reversed(specs), reversed(trackNames)):
+            newTrack = trackListInverted.add()  # track is added at the end
+            newTrack.parentScene = parentScene
+            newTrack["name"] = name
+            newTrack["enabled"] = spec.get("enabled", True)
+
+            trackType = spec.get("trackType", "STANDARD")
+            if "STANDARD" != trackType:
+                # set before the color since the update of the track type sets the color
+                newTrack.trackType = trackType
+
+            color = spec.get("color")
+            if color is None:
+                color = getColorFromTrackType(trackType)
+            if color is not None:
+                newTrack["color"] = color
+
+            if "" != spec.get("sceneName", ""):
+                newTrack.shotManagerScene = bpy.data.scenes[spec["sceneName"]]
+            if "" != spec.get("sceneTakeName", ""):
+                newTrack.sceneTakeName = spec["sceneTakeName"]
+
+        # move the new tracks, at the end of self.tracks, before the previous ones
+        if numPreviousTracks:
+            for i in range(len(specs)):
+                trackListInverted.move(numPreviousTracks + i, i)
+        self.invalidateTracksCache()
+
+        newTracks = [trackListInverted[len(specs) - 1 - i] for i in range(len(specs))]
+
+        # the update of the enabled property is not called
+        with utils_vse.vse_batch(parentScene):
+            for i, spec in enumerate(specs):
+                if not spec.get("enabled", True):
+                    utils_vse.muteChannel(parentScene, numPreviousTracks + 1 + i, True)
+
+        return newTracks
+
     def copyTrack(self, track, mode="CHANNEL_AND_HEADER", atIndex=-1, toIndex=-1):
         """ Copy a track after the selected track if possible or at the end of the track list otherwise
             Return the newly added track
@@ -304,6 +368,7 @@ class VideoTracks_Props(PropertyGroup):
                 # trackList.move(len(trackListInverted) - 1, atIndex)
                 trackListInverted.move(len(trackListInverted) - 1, len(trackListInverted) - toIndex)
                 newTrack = trackListInverted[len(trackListInverted) - toIndex]
+            self.invalidateTracksCache()
 
         if "CHANNEL_AND_HEADER" == mode or "CHANNEL" == mode:
             # toIndex = atIndex + 1
@@ -315,14 +380,16 @@ class VideoTracks_Props(PropertyGroup):
         self, track, mode="CHANNEL_AND_HEADER",
     ):
         trackInd = self.getTrackIndex(track)
-        if "CHANNEL_AND_HEADER" == mode or "HEADER" == mode:
-            print(f"Remove TRack: Name: {track.name} at {trackInd}")
-            utils_vse.clearChannel(self.parentScene, trackInd)
-            trackListInverted = self.tracks
-            trackListInverted.remove(len(trackListInverted) - trackInd)
+        with utils_vse.vse_batch(self.parentScene):
+            if "CHANNEL_AND_HEADER" == mode or "HEADER" == mode:
+                print(f"Remove TRack: Name: {track.name} at {trackInd}")
+                utils_vse.clearChannel(self.parentScene, trackInd)
+                trackListInverted = self.tracks
+                trackListInverted.remove(len(trackListInverted) - trackInd)
+                self.invalidateTracksCache()
 
-        if "CHANNEL_AND_HEADER" == mode or "CHANNEL" == mode:
-            utils_vse.removeChannel(self.parentScene, trackInd)
+            if "CHANNEL_AND_HEADER" == mode or "CHANNEL" == mode:
+                utils_vse.removeChannel(self.parentScene, trackInd)
 
     def setTrackInfo(
         self,
@@ -372,11 +439,10 @@ class VideoTracks_Props(PropertyGroup):
         return track
 
     def getTrackIndex(self, track):
-        trackList = self.getTracks()
-        for i in range(len(trackList)):
-            if track == trackList[i]:
-                return i + 1
-        return -1
+        if track is None:
+            return -1
+        _, trackIndices = self._getTracksCache()
+        return trackIndices.get(track.as_pointer(), -1)
         # trackInd = -1
 
         # trackList = self.getTracks()
@@ -396,19 +462,20 @@ class VideoTracks_Props(PropertyGroup):
         if "CHANNEL_AND_HEADER" == mode or "HEADER" == mode:
             trackListInverted = self.tracks
             trackListInverted.move(len(trackListInverted) - fromIndex, len(trackListInverted) - toIndex)
+            self.invalidateTracksCache()
             newTrack = trackListInverted[len(trackListInverted) - toIndex]
         else:
             newTrack = self.getTrackByIndex(fromIndex)
 
         if "CHANNEL_AND_HEADER" == mode or "CHANNEL" == mode:
-            utils_vse.swapChannels(self.parentScene, fromIndex, toIndex)
+            utils_vse.moveChannel(self.parentScene, fromIndex, toIndex)
 
         return newTrack
 
     def getTrackByIndex(self, trackIndex):
         if not (0 < trackIndex <= len(self.tracks)):
             return None
-        return self.getTracks()[trackIndex - 1]
+        return self._getTracksCache()[0][trackIndex - 1]
 
     def getTrackByName(self, trackName):
         for t in self.tracks:
@@ -421,7 +488,25 @@ class VideoTracks_Props(PropertyGroup):
             template list ui component.
             The list starts at 0 and ends at number of channels - 1
         """
-        return [t for t in reversed(self.tracks) if not ignoreDisabled or t.enabled]
+        tracks, _ = self._getTracksCache()
+        return [t for t in tracks if not ignoreDisabled or t.enabled]
+
+    def _getTracksCache(self):
+        """ Return the tuple (reversed track list, dictionary of the track indices by track pointer)
+            The cache is rebuilt after a call to invalidateTracksCache() or if the number of tracks changed
+        """
+        key = self.as_pointer()
+        cache = _tracksCaches.get(key)
+        if cache is None or len(cache[0]) != len(self.tracks):
+            tracks = list(reversed(self.tracks))
+            cache = (tracks, {t.as_pointer(): i + 1 for i, t in enumerate(tracks)})
+            _tracksCaches[key] = cache
+        return cache
+
+    def invalidateTracksCache(self):
+        """ To call when tracks are added, removed or moved in self.tracks
+        """
+        _tracksCaches.pop(self.as_pointer(), None)
 
     # def getTracksList(self, ignoreDisabled=False):
     #     trackList = []
@@ -445,8 +530,7 @@ class VideoTracks_Props(PropertyGroup):
         selTrackInd = self.getSelectedTrackIndex()
         if 0 >= selTrackInd:
             return None
-        trackList = self.getTracks()
-        return trackList[selTrackInd - 1]
+        return self.getTrackByIndex(selTrackInd)
         # selectedTrackInd = self.getSelectedTrackIndex()
         # selectedTrack = None
         # if -1 != selectedTrackInd:
@@ -464,31 +548,33 @@ class VideoTracks_Props(PropertyGroup):
 
     def updateTracksList(self, scene):
         """Add new track at the top of the list
+            There are at least 32 tracks, and enough tracks for all the used channels
         """
-        # numChannels = utils_vse.getNumUsedChannels(self.parentScene)
-
-        # if self.numTracks < numChannels:
-        #     self.numTracks = numChannels
-
-        if 32 > self.numTracks:
-            self.numTracks = 32
+        numTracks = max(32, utils_vse.getNumUsedChannels(self.parentScene))
+        if numTracks > self.numTracks:
+            self.numTracks = numTracks
 
     ####################
     # channels
     ####################
 
     def getChannelClips(self, channelIndex):
-        clipsList = list()
-        for seq in self.parentScene.sequence_editor.sequences:
-            if channelIndex == seq.channel:
-                clipsList.append(seq)
-
-        return clipsList
+        return utils_vse.getChannelClips(self.parentScene, channelIndex)
 
     def getChannelClipsNumber(self, channelIndex):
         clipsList = self.getChannelClips(channelIndex)
         return len(clipsList)
 
+    def getChannelExtent(self, channelIndex):
+        """ Return the tuple (first frame, last frame + 1) of the clips of the channel, None if it has no clip
+        """
+        return utils_vse.getChannelIndex(self.parentScene).get_channel_extent(channelIndex)
+
+    def getContentExtent(self):
+        """ Return the tuple (first frame, last frame + 1) of all the clips of the sequencer, None if it is empty
+        """
+        return utils_vse.getChannelIndex(self.parentScene).get_extent()
+
 
 _classes = (
     UAS_VideoTracks_Track,
@@ -502,8 +588,15 @@ def register():
 
     bpy.types.Scene.UAS_video_tracks_props = PointerProperty(type=VideoTracks_Props)
 
+    for handlerCateg in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        utils_handlers.removeAllHandlerOccurences(vt_tracksCache_reset, handlerCateg=handlerCateg)
+        handlerCateg.append(vt_tracksCache_reset)
+
 
 def unregister():
+    for handlerCateg in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        utils_handlers.removeAllHandlerOccurences(vt_tracksCache_reset, handlerCateg=handlerCateg)
+    _tracksCaches.clear()
 
     del bpy.types.Scene.UAS_video_tracks_props
 
@@ -34,6 +34,7 @@ from bpy.props import (
 
 from videotracks.config import config
 from videotracks.utils import utils
+from videotracks.utils import utils_vse
 
 
 # This operator requires   from bpy_extras.io_utils import ImportHelper
@@ -380,6 +381,9 @@ class UAS_Vse_Render(PropertyGroup):
         # Clip creation
         ##########
 
+        # strips waiting for removal in a vse_batch would make the new strip move to another channel
+        utils_vse.applyPendingRemovals(scene)
+
         newClip = None
         mediaType = self.getMediaType(mediaPath)
         # print(f"Media type:{mediaType}, media:{mediaPath}")
@@ -463,36 +467,19 @@ class UAS_Vse_Render(PropertyGroup):
 
     # wkip added to utils_vse
     def clearAllChannels(self, scene):
-        for seq in scene.sequence_editor.sequences:
-            scene.sequence_editor.sequences.remove(seq)
-
-        bpy.ops.sequencer.refresh_all()
+        utils_vse.clearAllChannels(scene)
 
     # wkip added to utils_vse
     def clearChannel(self, scene, channelIndex):
-        sequencesList = list()
-        for seq in scene.sequence_editor.sequences:
-            if channelIndex == seq.channel:
-                sequencesList.append(seq)
-
-        for seq in sequencesList:
-            scene.sequence_editor.sequences.remove(seq)
-
-        bpy.ops.sequencer.refresh_all()
+        utils_vse.clearChannel(scene, channelIndex)
 
     # wkip added to utils_vse
     def getChannelClips(self, scene, channelIndex):
-        sequencesList = list()
-        for seq in scene.sequence_editor.sequences:
-            if channelIndex == seq.channel:
-                sequencesList.append(seq)
-
-        return sequencesList
+        return utils_vse.getChannelClips(scene, channelIndex)
 
     def deselectChannel(self, scene, channelIndex):
-        for seq in scene.sequence_editor.sequences:
-            if channelIndex == seq.channel:
-                seq.select = False
+        for seq in utils_vse.getChannelClips(scene, channelIndex):
+            seq.select = False
 
     def deselectAllChannel(self, scene):
         for seq in scene.sequence_editor.sequences:
@@ -523,27 +510,11 @@ class UAS_Vse_Render(PropertyGroup):
 
     # wkip added to utils_vse
     def changeClipsChannel(self, scene, sourceChannelIndex, targetChannelIndex):
-        sourceSequencesList = self.getChannelClips(scene, sourceChannelIndex)
-        targetSequencesList = list()
-
-        if len(sourceSequencesList):
-            targetSequencesList = self.getChannelClips(scene, targetChannelIndex)
-
-            # we need to clear the target channel before doing the switch otherwise some clips may get moved to another channel
-            if len(targetSequencesList):
-                self.clearChannel(self.parentScene, targetChannelIndex)
-
-            for clip in sourceSequencesList:
-                clip.channel = targetChannelIndex
-
-        return targetSequencesList
+        return utils_vse.changeClipsChannel(scene, sourceChannelIndex, targetChannelIndex)
 
     # wkip added to utils_vse
     def swapChannels(self, scene, channelIndexA, channelIndexB):
-        tempChannelInd = 0
-        self.changeClipsChannel(scene, channelIndexA, tempChannelInd)
-        self.changeClipsChannel(scene, channelIndexB, channelIndexA)
-        self.changeClipsChannel(scene, tempChannelInd, channelIndexB)
+        utils_vse.swapChannels(scene, channelIndexA, channelIndexB)
 
     def cropClipToCanvas(
         self, canvasWidth, canvasHeight, clip, clipWidth, clipHeight, clipRenderPercentage=100, mode="FIT_ALL"
@@ -585,12 +556,12 @@ class UAS_Vse_Render(PropertyGroup):
         # wkipwkipwkip erreur ici, devrait etre exclusive pour extre consistant et ne l'est pas
         """get_frame_end is exclusive in order to follow the Blender implementation of get_frame_end for its clips
         """
-        videoChannelClips = self.getChannelClips(scene, 1)
+        videoChannelExtent = utils_vse.getChannelIndex(scene).get_channel_extent(1)
         scene_frame_start = scene.frame_start  # scene.sequence_editor.sequences
 
         frame_end = scene_frame_start
-        if len(videoChannelClips):
-            frame_end = videoChannelClips[len(videoChannelClips) - 1].frame_final_end
+        if videoChannelExtent is not None:
+            frame_end = videoChannelExtent[1]
 
         frame_end = max(frame_end, scene_frame_start)
 
@@ -20,12 +20,12 @@ To do: module description here.
 """
 
 import os
-import re
 from pathlib import Path
-from urllib.parse import unquote_plus, urlparse
 
 import bpy
 
+from .utils_os import file_path_from_url  # noqa: F401
+
 
 def convertVersionStrToInt(versionStr):
     """ Convert a string formated like "1.23.48" to a version integer such as 1023048
@@ -144,6 +144,29 @@ class PropertyRestoreCtx:
             setattr(p[0], p[1], p[2])
 
 
+def getOperatorPropertyValues(operator, excludedProperties=()):
+    """ Return a dictionary of the values of the properties of the operator, that can be dumped to json and given
+        as keyword arguments to the operator call
+        Pointer and collection properties, and enum properties with dynamic items, are not included
+    """
+    values = dict()
+    for prop in operator.bl_rna.properties:
+        if "rna_type" == prop.identifier or prop.identifier in excludedProperties:
+            continue
+        if prop.type not in ("BOOLEAN", "INT", "FLOAT", "STRING", "ENUM"):
+            continue
+        if "ENUM" == prop.type and not len(prop.enum_items):
+            continue
+
+        value = getattr(operator, prop.identifier)
+        if "ENUM" == prop.type and prop.is_enum_flag:
+            value = list(value)
+        elif getattr(prop, "is_array", False):
+            value = list(value)
+        values[prop.identifier] = value
+    return values
+
+
 def ShowMessageBox(message="", title="Message Box", icon="INFO"):
     """
         # #Shows a message box with a specific message 
@@ -179,21 +202,6 @@ def ShowMessageBox(message="", title="Message Box", icon="INFO"):
 # ShowMessageBox("This is a message", "This is a custom title", 'ERROR')
 
 
-def file_path_from_url(url):
-    path = ""
-    if url.startswith("file"):
-        path = unquote_plus(urlparse(url).path).replace("\\", "//")
-    else:
-        path = url.replace("\\", "/")  # //
-
-    #  print("ulr 2 path: ", path)
-    if re.match(r"^/\S:.*", path):  # Remove leading /
-        path = path[1:]
-    #  print("ulr 3 path: ", path)
-
-    return path
-
-
 def openMedia(media_filepath, inExternalPlayer=False):
     if not Path(media_filepath).exists():
         print(f"*** Cannot open {media_filepath}")
@@ -244,21 +252,45 @@ def openMedia(media_filepath, inExternalPlayer=False):
 ###################
 
 
+class UniqueNameAllocator:
+    """ Return names that are unique among a set of names, the set being built once
+        A name already used gets the first free suffix .000, .001... Then the next suffix to try is kept by name
+        so that allocating many times the same name is O(1) amortized
+        Eg: allocator = UniqueNameAllocator(t.name for t in tracks)
+            newNames = allocator.allocate_names(["Track", "Track"])
+    """
+
+    def __init__(self, names=()):
+        self._usedNames = set(names)
+        self._nextSuffixInd = dict()
+
+    def allocate(self, name):
+        """ Return a unique name based on name and mark it as used
+        """
+        if name not in self._usedNames:
+            self._usedNames.add(name)
+            return name
+
+        suffixInd = self._nextSuffixInd.get(name, 0)
+        newName = name + ".{:03}".format(suffixInd)
+        while newName in self._usedNames:
+            suffixInd += 1
+            newName = name + ".{:03}".format(suffixInd)
+        self._nextSuffixInd[name] = suffixInd + 1
+        self._usedNames.add(newName)
+        return newName
+
+    def allocate_names(self, names):
+        """ Return the list of the unique names allocated for each name of the list, in the same order
+        """
+        return [self.allocate(name) for name in names]
+
+
 def findFirstUniqueName(originalItem, name, itemsArray):
     """ Return a string that correspont to name.xxx as the first unique name in the array
     """
-    itemInd = 0
-    numDuplicatesFound = 0
-    newIndexStr = ".{:03}"
-    newName = name
-    while itemInd < len(itemsArray):
-        if itemsArray[itemInd] != originalItem and newName == itemsArray[itemInd].name:
-            newName = name + newIndexStr.format(numDuplicatesFound)
-            numDuplicatesFound += 1
-            itemInd = 0
-        else:
-            itemInd += 1
-    return newName
+    allocator = UniqueNameAllocator(item.name for item in itemsArray if item != originalItem)
+    return allocator.allocate(name)
 
 
 def getSceneVSE(vsm_sceneName, createVseTab=False):
@@ -21,7 +21,9 @@ Utility functions that may require os/platform specific adjustments
 
 import subprocess
 import os
+import re
 from pathlib import Path
+from urllib.parse import unquote_plus, urlparse
 import sys
 
 
@@ -90,6 +92,21 @@ def internet_on():
     return False
 
 
+def file_path_from_url(url):
+    path = ""
+    if url.startswith("file"):
+        path = unquote_plus(urlparse(url).path).replace("\\", "//")
+    else:
+        path = url.replace("\\", "/")  # //
+
+    #  print("ulr 2 path: ", path)
+    if re.match(r"^/\S:.*", path):  # Remove leading /
+        path = path[1:]
+    #  print("ulr 3 path: ", path)
+
+    return path
+
+
 def module_can_be_imported(name):
     """Check if the specified module already exists in the current Python environment
     To get a submodule: eg: module_can_be_imported("stampinfo.otio")
@@ -113,3 +130,94 @@ def is_admin():
     except AttributeError:
         is_user_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
     return is_user_admin
+
+
+class MediaResolver:
+    """ Find media files from their path or their name in a list of search folders, in priority order.
+        Each folder is listed only once with os.scandir and kept as a name to path map, and paths that
+        have not been found are remembered, so resolving many media costs a few folder listings instead
+        of one file system access per media and per folder.
+        The content of the folders is read when first needed: use clear() if files may have changed since.
+    """
+
+    def __init__(self, search_roots=None):
+        self.search_roots = list()
+        self._folderIndices = dict()
+        self._resolvedPaths = dict()
+        if search_roots is not None:
+            for folder in search_roots:
+                self.add_search_root(folder)
+
+    def add_search_root(self, folder):
+        """ Add a folder in which media are looked for by name. Folders added first have the priority
+        """
+        if folder is None or "" == str(folder):
+            return
+        folder = str(folder)
+        if folder not in self.search_roots:
+            self.search_roots.append(folder)
+            self._resolvedPaths.clear()
+
+    def clear(self):
+        """ Forget the content of the folders and the paths already resolved
+        """
+        self._folderIndices.clear()
+        self._resolvedPaths.clear()
+
+    def _get_folder_index(self, folder):
+        folderKey = os.path.normcase(os.path.abspath(folder))
+        folderIndex = self._folderIndices.get(folderKey)
+        if folderIndex is None:
+            folderIndex = dict()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            folderIndex[os.path.normcase(entry.name)] = entry.path
+            except OSError:
+                # folder not found or not readable
+                pass
+            self._folderIndices[folderKey] = folderIndex
+        return folderIndex
+
+    def find_in_folder(self, folder, fileName):
+        """ Return the path of the file named fileName in folder, None if not found
+        """
+        if folder is None or "" == str(folder) or "" == fileName:
+            return None
+        return self._get_folder_index(str(folder)).get(os.path.normcase(fileName))
+
+    def exists(self, filePath):
+        """ Return True if the file exists, using the index of its parent folder
+        """
+        if filePath is None or "" == str(filePath):
+            return False
+        folder, fileName = os.path.split(str(filePath))
+        return self.find_in_folder(folder if "" != folder else ".", fileName) is not None
+
+    def resolve(self, mediaPath, search_roots=None):
+        """ Return the path of the media as a string, None if not found
+            The path itself is tried first, then the file name of the media in search_roots if specified,
+            otherwise in the search roots of the resolver
+        """
+        if mediaPath is None or "" == str(mediaPath):
+            return None
+        mediaPath = str(mediaPath)
+        roots = self.search_roots if search_roots is None else [str(r) for r in search_roots if r]
+
+        key = (mediaPath, tuple(roots))
+        if key in self._resolvedPaths:
+            return self._resolvedPaths[key]
+
+        resolvedPath = None
+        folder, fileName = os.path.split(mediaPath)
+        if self.find_in_folder(folder if "" != folder else ".", fileName) is not None:
+            resolvedPath = mediaPath
+        else:
+            for root in roots:
+                resolvedPath = self.find_in_folder(root, fileName)
+                if resolvedPath is not None:
+                    break
+
+        self._resolvedPaths[key] = resolvedPath
+        return resolvedPath
@@ -20,7 +20,20 @@ To do: module description here.
 """
 
 import os
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from itertools import accumulate
+
+import numpy as np
+
 import bpy
+from bpy.app.handlers import persistent
+
+from . import utils_handlers
+
+from ..config import sm_logging
+
+_logger = sm_logging.getLogger(__name__)
 
 
 ###################
@@ -65,40 +78,468 @@ def showSecondsInVSE(showSeconds, workspace=None):
                         space_data.show_seconds = showSeconds
 
 
+###################
+# channel index
+###################
+
+
+def getMaxNumChannels():
+    """ Return the number of channels of the sequence editor of the running Blender (32 before 2.92, 128 after)
+    """
+    try:
+        return bpy.types.Sequence.bl_rna.properties["channel"].hard_max
+    except (AttributeError, KeyError):
+        return 32
+
+
+class ChannelIndex:
+    """ Strips of the sequence editor of a scene grouped by channel, built in a single pass over the strips
+        The index is kept between the calls of the channel functions of this module. It is invalidated by these
+        functions when they modify the channels, and by a depsgraph handler when the sequencer is edited
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self._channels = dict()
+        # tuple (first frame, last frame + 1) of the strips of each channel
+        self._extents = dict()
+        # sorted intervals of the strips of each channel, built on demand, see _get_channel_intervals()
+        self._intervals = dict()
+        self._numSequences = -1
+        self._valid = False
+
+    def _get_sequences(self):
+        if self.scene.sequence_editor is None:
+            return []
+        return self.scene.sequence_editor.sequences
+
+    def _build(self):
+        self._channels = dict()
+        self._extents = dict()
+        self._intervals = dict()
+        sequences = self._get_sequences()
+        for seq in sequences:
+            self._channels.setdefault(seq.channel, []).append(seq)
+            extent = self._extents.get(seq.channel)
+            if extent is None:
+                self._extents[seq.channel] = (seq.frame_final_start, seq.frame_final_end)
+            else:
+                self._extents[seq.channel] = (
+                    min(extent[0], seq.frame_final_start),
+                    max(extent[1], seq.frame_final_end),
+                )
+        self._numSequences = len(sequences)
+        self._valid = True
+
+    def is_valid(self):
+        # strips added or removed since the index was built also make it invalid
+        return self._valid and len(self._get_sequences()) == self._numSequences
+
+    def invalidate(self):
+        self._valid = False
+
+    def get_channel_clips(self, channelIndex):
+        if not self.is_valid():
+            self._build()
+        return list(self._channels.get(channelIndex, ()))
+
+    def get_channels(self):
+        """ Return a dictionary of the lists of strips by channel index, for the channels used by strips
+        """
+        if not self.is_valid():
+            self._build()
+        return {channel: list(clips) for channel, clips in self._channels.items()}
+
+    def get_num_used_channels(self):
+        if not self.is_valid():
+            self._build()
+        return max(self._channels.keys(), default=0)
+
+    def get_used_channels(self):
+        """ Return the sorted list of the indices of the channels having strips
+        """
+        if not self.is_valid():
+            self._build()
+        return sorted(self._channels.keys())
+
+    def get_channel_extent(self, channelIndex):
+        """ Return the tuple (first frame, last frame + 1) of the strips of the channel, None if it is empty
+        """
+        if not self.is_valid():
+            self._build()
+        return self._extents.get(channelIndex)
+
+    def get_extent(self):
+        """ Return the tuple (first frame, last frame + 1) of all the strips, None if there is no strip
+        """
+        if not self.is_valid():
+            self._build()
+        if not len(self._extents):
+            return None
+        return (min(e[0] for e in self._extents.values()), max(e[1] for e in self._extents.values()))
+
+    def _get_channel_intervals(self, channelIndex):
+        """ Return the tuple (strips sorted by start, their starts, running maximum of their ends) of the channel
+            The running maximum of the ends is sorted too, so both lists can be searched with bisect
+        """
+        if not self.is_valid():
+            self._build()
+        intervals = self._intervals.get(channelIndex)
+        if intervals is None:
+            clips = sorted(self._channels.get(channelIndex, ()), key=lambda c: c.frame_final_start)
+            starts = [c.frame_final_start for c in clips]
+            maxEnds = list(accumulate((c.frame_final_end for c in clips), max))
+            intervals = (clips, starts, maxEnds)
+            self._intervals[channelIndex] = intervals
+        return intervals
+
+    def get_strip_at(self, channelIndex, frame):
+        """ Return the strip of the channel at the specified frame, None if there is none
+            If several strips overlap at this frame the one starting the latest is returned
+        """
+        clips, starts, maxEnds = self._get_channel_intervals(channelIndex)
+        ind = bisect_right(starts, frame) - 1
+        while 0 <= ind and frame < maxEnds[ind]:
+            if frame < clips[ind].frame_final_end:
+                return clips[ind]
+            ind -= 1
+        return None
+
+    def find_gaps(self, channelIndex, frameStart=None, frameEnd=None):
+        """ Return the list of the tuples (first frame, last frame + 1) of the empty ranges between the strips of the
+            channel
+            When frameStart and frameEnd are specified the search is limited to this range, frameEnd being excluded,
+            and the empty ranges before the first strip and after the last one are included
+        """
+        clips, starts, maxEnds = self._get_channel_intervals(channelIndex)
+        firstInd = 0 if frameStart is None else bisect_right(maxEnds, frameStart)
+        lastInd = len(clips) if frameEnd is None else bisect_left(starts, frameEnd)
+
+        gaps = list()
+        coveredEnd = frameStart
+        for ind in range(firstInd, lastInd):
+            clip = clips[ind]
+            if coveredEnd is not None and coveredEnd < clip.frame_final_start:
+                gaps.append((coveredEnd, clip.frame_final_start))
+            if coveredEnd is None or coveredEnd < clip.frame_final_end:
+                coveredEnd = clip.frame_final_end
+        if frameEnd is not None and coveredEnd is not None and coveredEnd < frameEnd:
+            gaps.append((coveredEnd, frameEnd))
+        return gaps
+
+    def find_overlaps(self, channelIndex):
+        """ Return the list of the tuples (strip, overlapping strip) of the channel, sorted by start of the
+            overlapping strip. The first strip of a tuple is the one ending the latest among the previous strips
+        """
+        clips, _, _ = self._get_channel_intervals(channelIndex)
+        overlaps = list()
+        coveringClip = None
+        for clip in clips:
+            if coveringClip is not None and clip.frame_final_start < coveringClip.frame_final_end:
+                overlaps.append((coveringClip, clip))
+            if coveringClip is None or coveringClip.frame_final_end < clip.frame_final_end:
+                coveringClip = clip
+        return overlaps
+
+
+# channel indices by scene
+_channelIndices = dict()
+
+
+def getChannelIndex(scene):
+    """ Return the channel index of the scene, up to date
+    """
+    applyPendingRemovals(scene)
+    key = scene.as_pointer()
+    channelIndex = _channelIndices.get(key)
+    if channelIndex is None:
+        channelIndex = ChannelIndex(scene)
+        _channelIndices[key] = channelIndex
+    else:
+        channelIndex.scene = scene
+    return channelIndex
+
+
+def invalidateChannelIndex(scene=None):
+    """ Invalidate the channel index of the specified scene, or of all the scenes if scene is None
+    """
+    if scene is None:
+        for channelIndex in _channelIndices.values():
+            channelIndex.invalidate()
+    else:
+        channelIndex = _channelIndices.get(scene.as_pointer())
+        if channelIndex is not None:
+            channelIndex.invalidate()
+
+
+@persistent
+def vt_channelIndex_depsgraph_update_post(scene, depsgraph=None):
+    # strips are moved or edited in the sequencer
+    if depsgraph is None or depsgraph.id_type_updated("SCENE"):
+        invalidateChannelIndex()
+
+
+@persistent
+def vt_channelIndex_reset(dummy):
+    # the strips, and the scenes, are new data after a file load, an undo or a redo
+    _channelIndices.clear()
+
+
+###################
+# sequencer view
+###################
+
+
+def getSequencerArea(context):
+    """ Return the area of the context if it is a sequence editor, the first sequence editor area of the screen
+        otherwise, None if there is none
+    """
+    if context.area is not None and "SEQUENCE_EDITOR" == context.area.type:
+        return context.area
+    if context.screen is not None:
+        for area in context.screen.areas:
+            if "SEQUENCE_EDITOR" == area.type:
+                return area
+    return None
+
+
+def setSequencerViewRange(area, frameStart, frameEnd, channelStart=None, channelEnd=None, marginPercent=5):
+    """ Zoom the timeline of the sequence editor area to frame the specified range, without modifying the strips
+        frameEnd and channelEnd are excluded
+        If channelStart or channelEnd is None the current vertical range of the view is kept
+        Return False if the area has no timeline region
+    """
+    region = None
+    for r in area.regions:
+        if "WINDOW" == r.type:
+            region = r
+    if region is None:
+        return False
+
+    view2d = region.view2d
+    if channelStart is None or channelEnd is None:
+        _, channelStart = view2d.region_to_view(0, 0)
+        _, channelEnd = view2d.region_to_view(0, region.height)
+
+    margin = (frameEnd - frameStart) * marginPercent * 0.01
+    xmin, ymin = view2d.view_to_region(frameStart - margin, channelStart, clip=False)
+    xmax, ymax = view2d.view_to_region(frameEnd + margin, channelEnd, clip=False)
+    zoomArgs = {"xmin": int(xmin), "xmax": int(xmax), "ymin": int(ymin), "ymax": int(ymax), "wait_for_input": False}
+
+    if hasattr(bpy.context, "temp_override"):
+        with bpy.context.temp_override(area=area, region=region):
+            bpy.ops.view2d.zoom_border(**zoomArgs)
+    else:
+        override = bpy.context.copy()
+        override["area"] = area
+        override["region"] = region
+        bpy.ops.view2d.zoom_border(override, **zoomArgs)
+    return True
+
+
+###################
+# batched modifications
+###################
+
+
+class VseBatch:
+    """ Modifications of the sequencer of a scene made in a vse_batch() context
+        The sequencer refresh, the redraw of the sequencer areas and the changes of the channel properties
+        are done only once, when the context exits. The strips to remove are removed in a single sweep,
+        before the strips or the channels are queried or modified
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.refreshNeeded = False
+        self.redrawNeeded = False
+        self.clipsToRemove = list()
+        # deferred calls by key, only the last call registered for a key is done
+        self.deferredCalls = dict()
+
+    def defer(self, key, func, *args):
+        self.deferredCalls.pop(key, None)
+        self.deferredCalls[key] = (func, args)
+
+    def apply_removals(self):
+        if len(self.clipsToRemove):
+            sequences = self.scene.sequence_editor.sequences
+            for clip in self.clipsToRemove:
+                sequences.remove(clip)
+            self.clipsToRemove = list()
+            invalidateChannelIndex(self.scene)
+            self.refreshNeeded = True
+
+    def apply_deferred_calls(self):
+        deferredCalls = self.deferredCalls
+        self.deferredCalls = dict()
+        for func, args in deferredCalls.values():
+            func(*args)
+
+    def flush(self):
+        self.apply_removals()
+        self.apply_deferred_calls()
+        if self.refreshNeeded:
+            bpy.ops.sequencer.refresh_all()
+        if self.redrawNeeded:
+            tagSequencerRedraw()
+
+
+# batches in progress by scene
+_vseBatches = dict()
+
+
+@contextmanager
+def vse_batch(scene):
+    """ Context in which the modifications of the sequencer made by the functions of this module are batched
+        eg: with utils_vse.vse_batch(scene):
+                clearChannel(scene, 2)
+                ...
+        Nested contexts on the same scene share the batch of the outermost one
+    """
+    key = scene.as_pointer()
+    if key in _vseBatches:
+        yield _vseBatches[key]
+        return
+
+    batch = VseBatch(scene)
+    _vseBatches[key] = batch
+    try:
+        yield batch
+    finally:
+        # the batch is removed first so that the deferred calls are done directly
+        del _vseBatches[key]
+        batch.flush()
+
+
+def getVseBatch(scene):
+    """ Return the batch in progress on the scene, None if there is none
+    """
+    return _vseBatches.get(scene.as_pointer())
+
+
+def applyPendingChanges(scene):
+    """ Apply the removals and the deferred channel property changes of the batch in progress on the scene, if any
+        To call before strips are moved or copied
+    """
+    batch = _vseBatches.get(scene.as_pointer())
+    if batch is not None:
+        batch.apply_removals()
+        batch.apply_deferred_calls()
+
+
+def applyPendingRemovals(scene):
+    """ Remove the strips waiting for removal in the batch in progress on the scene, if any
+        To call before adding strips to the sequencer
+    """
+    batch = _vseBatches.get(scene.as_pointer())
+    if batch is not None:
+        batch.apply_removals()
+
+
+def removeClips(scene, clips):
+    batch = getVseBatch(scene)
+    if batch is not None:
+        batch.clipsToRemove.extend(clips)
+        return
+
+    for clip in clips:
+        scene.sequence_editor.sequences.remove(clip)
+    invalidateChannelIndex(scene)
+
+
+def refreshSequencer(scene):
+    batch = getVseBatch(scene)
+    if batch is not None:
+        batch.refreshNeeded = True
+    else:
+        bpy.ops.sequencer.refresh_all()
+
+
+def tagSequencerRedraw(scene=None):
+    if scene is not None:
+        batch = getVseBatch(scene)
+        if batch is not None:
+            batch.redrawNeeded = True
+            return
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if "SEQUENCE_EDITOR" == area.type:
+                area.tag_redraw()
+
+
 ###################
 # vse sequences
 ###################
 
 
 def clearChannel(scene, channelIndex):
-    sequencesList = list()
-    for seq in scene.sequence_editor.sequences:
-        if channelIndex == seq.channel:
-            sequencesList.append(seq)
-    for seq in sequencesList:
-        scene.sequence_editor.sequences.remove(seq)
-    bpy.ops.sequencer.refresh_all()
+    sequencesList = getChannelClips(scene, channelIndex)
+    removeClips(scene, sequencesList)
+    refreshSequencer(scene)
+    tagSequencerRedraw(scene)
 
 
 def clearAllChannels(scene):
-    for seq in scene.sequence_editor.sequences:
-        scene.sequence_editor.sequences.remove(seq)
-    bpy.ops.sequencer.refresh_all()
+    applyPendingRemovals(scene)
+    removeClips(scene, list(scene.sequence_editor.sequences))
+    refreshSequencer(scene)
+    tagSequencerRedraw(scene)
 
 
 def getChannelClips(scene, channelIndex):
-    sequencesList = list()
-    for seq in scene.sequence_editor.sequences:
-        if channelIndex == seq.channel:
-            sequencesList.append(seq)
-    return sequencesList
+    return getChannelIndex(scene).get_channel_clips(channelIndex)
 
 
 def getNumUsedChannels(scene):
-    numChannels = 0
-    for i, seq in enumerate(scene.sequence_editor.sequences):
-        numChannels = max(seq.channel, numChannels)
-    return numChannels
+    return getChannelIndex(scene).get_num_used_channels()
+
+
+def remapChannels(scene, channelMapping, numChannels=None):
+    """ Move all the strips of the channels given as keys of channelMapping to the channels given as values
+        Channels are moved in an order such that a channel is always moved to an empty one, and the channels of a
+        cycle (eg: a swap) go through a free channel. Strips are then never shuffled by the overlap check of Blender
+        Target channels not in the mapping keys have to be empty
+        numChannels: number of channels in which a free channel can be found, all the channels if None
+    """
+    if numChannels is None:
+        numChannels = getMaxNumChannels()
+
+    # deferred channel properties have to be set on the strips before they move
+    applyPendingChanges(scene)
+
+    channels = getChannelIndex(scene).get_channels()
+    pendingMoves = {src: dst for src, dst in channelMapping.items() if src != dst and src in channels}
+    if not len(pendingMoves):
+        return
+
+    def _moveChannelClips(src, dst):
+        for clip in channels[src]:
+            clip.channel = dst
+        channels.setdefault(dst, []).extend(channels.pop(src))
+
+    while len(pendingMoves):
+        # channels which target is not waiting to be emptied
+        readyChannels = [src for src, dst in pendingMoves.items() if dst not in pendingMoves]
+        if len(readyChannels):
+            for src in readyChannels:
+                _moveChannelClips(src, pendingMoves.pop(src))
+        else:
+            # only cycles remain: one channel of a cycle is moved to a free channel to break it
+            src = next(iter(pendingMoves))
+            targetChannels = set(channelMapping.values())
+            freeChannel = next(
+                (ch for ch in range(numChannels, 0, -1) if ch not in channels and ch not in targetChannels), None
+            )
+            if freeChannel is None:
+                _logger.error("remapChannels: No free channel to move the strips, aborting")
+                break
+            _moveChannelClips(src, freeChannel)
+            pendingMoves[freeChannel] = pendingMoves.pop(src)
+
+    invalidateChannelIndex(scene)
+    tagSequencerRedraw(scene)
 
 
 def changeClipsChannel(scene, sourceChannelIndex, targetChannelIndex):
@@ -112,56 +553,120 @@ def changeClipsChannel(scene, sourceChannelIndex, targetChannelIndex):
         if len(targetSequencesList):
             clearChannel(scene, targetChannelIndex)
 
-        for clip in sourceSequencesList:
-            clip.channel = targetChannelIndex
+        remapChannels(scene, {sourceChannelIndex: targetChannelIndex})
 
     return targetSequencesList
 
 
 def swapChannels(scene, channelIndexA, channelIndexB):
-    tempChannelInd = 0
-    changeClipsChannel(scene, channelIndexA, tempChannelInd)
-    changeClipsChannel(scene, channelIndexB, channelIndexA)
-    changeClipsChannel(scene, tempChannelInd, channelIndexB)
+    remapChannels(scene, {channelIndexA: channelIndexB, channelIndexB: channelIndexA})
+
+
+def moveChannel(scene, fromChannelIndex, toChannelIndex):
+    """ Move the content of a channel to another channel, the channels in between being shifted by one
+    """
+    channelMapping = {fromChannelIndex: toChannelIndex}
+    # only the channels having strips are moved
+    for ch in getChannelIndex(scene).get_used_channels():
+        if fromChannelIndex < ch <= toChannelIndex:
+            channelMapping[ch] = ch - 1
+        elif toChannelIndex <= ch < fromChannelIndex:
+            channelMapping[ch] = ch + 1
+    remapChannels(scene, channelMapping)
+
+
+def setChannelClipsAttribute(scene, channelIndex, attrName, value, dtype):
+    """ Set the attribute of all the strips of the channel in bulk, with foreach_get and foreach_set on the
+        sequences of the sequence editor
+        foreach_set does not call the update callbacks of the property, so the cache of the visual strips is
+        invalidated here and the sound and meta strips, which update the audio system, are set one by one
+        If the attribute is not available for all the strips, it is set one strip at a time on the strips of
+        the channel having it
+    """
+    if scene.sequence_editor is None:
+        return
+    sequences = scene.sequence_editor.sequences
+    numSequences = len(sequences)
+    if not numSequences:
+        return
+
+    channels = np.empty(numSequences, dtype=np.int32)
+    sequences.foreach_get("channel", channels)
+    mask = channels == channelIndex
+    if not mask.any():
+        return
+
+    values = np.empty(numSequences, dtype=dtype)
+    try:
+        sequences.foreach_get(attrName, values)
+    except (AttributeError, TypeError, RuntimeError):
+        setChannelClipsAttributeByClip(scene, channelIndex, attrName, value)
+        return
+
+    values[mask] = value
+    sequences.foreach_set(attrName, values)
+
+    for clip in getChannelClips(scene, channelIndex):
+        if clip.type in ("SOUND", "META"):
+            # setting the property calls its update callback
+            setattr(clip, attrName, value)
+        else:
+            clip.invalidate_cache("COMPOSITE")
+    tagSequencerRedraw(scene)
+
+
+def setChannelClipsAttributeByClip(scene, channelIndex, attrName, value):
+    """ Set the attribute of the strips of the channel having it, one strip at a time
+    """
+    for clip in getChannelClips(scene, channelIndex):
+        if hasattr(clip, attrName):
+            setattr(clip, attrName, value)
 
 
 def muteChannel(scene, channelIndex, mute):
-    if scene.sequence_editor is not None:
-        for i, seq in enumerate(scene.sequence_editor.sequences):
-            if channelIndex == seq.channel:
-                seq.mute = mute
+    batch = getVseBatch(scene)
+    if batch is not None:
+        batch.defer(("mute", channelIndex), muteChannel, scene, channelIndex, mute)
+        return
+
+    setChannelClipsAttribute(scene, channelIndex, "mute", mute, np.bool_)
 
 
 def setChannelAlpha(scene, channelIndex, alpha):
     """Alpha is in range [0, 1]
     """
-    channelClips = getChannelClips(scene, channelIndex)
-    for clip in channelClips:
-        clip.blend_alpha = alpha
+    batch = getVseBatch(scene)
+    if batch is not None:
+        batch.defer(("blend_alpha", channelIndex), setChannelAlpha, scene, channelIndex, alpha)
+        return
+
+    setChannelClipsAttribute(scene, channelIndex, "blend_alpha", alpha, np.float32)
 
 
 def setChannelVolume(scene, channelIndex, volume):
     """Volume is in range [0, 10 or above]
     """
-    channelClips = getChannelClips(scene, channelIndex)
-    for clip in channelClips:
-        clip.volume = volume
+    batch = getVseBatch(scene)
+    if batch is not None:
+        batch.defer(("volume", channelIndex), setChannelVolume, scene, channelIndex, volume)
+        return
 
+    # only the sound strips have a volume, so foreach_get cannot be used on the sequences of the scene
+    setChannelClipsAttributeByClip(scene, channelIndex, "volume", volume)
 
-def insertChannel(scene, channelIndex):
-    numChannels = 32
-    for ch in range(numChannels, channelIndex - 1, -1):
-        channelClips = getChannelClips(scene, ch)
 
-        if 32 == ch and len(channelClips):
-            print("VSE Insert Channel: *** Clips in channel 32 will be removed ***")
+def insertChannel(scene, channelIndex):
+    numChannels = getMaxNumChannels()
+    if len(getChannelClips(scene, numChannels)):
+        print(f"VSE Insert Channel: *** Clips in channel {numChannels} will be removed ***")
+        clearChannel(scene, numChannels)
 
-        for clip in channelClips:
-            clip.channel = ch + 1
+    usedChannels = getChannelIndex(scene).get_used_channels()
+    remapChannels(scene, {ch: ch + 1 for ch in usedChannels if channelIndex <= ch}, numChannels=numChannels)
 
 
 def duplicateChannel(scene, sourceChannelIndex, targetChannelIndex):
-    numChannels = 32
+    numChannels = getMaxNumChannels()
     print(f"sourceChannelIndex: {sourceChannelIndex}, targetChannelIndex: {targetChannelIndex}")
     if (
         not 1 <= targetChannelIndex <= numChannels
@@ -173,6 +678,7 @@ def duplicateChannel(scene, sourceChannelIndex, targetChannelIndex):
     srcChannelInd = sourceChannelIndex if sourceChannelIndex < targetChannelIndex else sourceChannelIndex + 1
 
     insertChannel(scene, targetChannelIndex)
+    applyPendingChanges(scene)
     channelClips = getChannelClips(scene, srcChannelInd)
     bpy.ops.sequencer.select_all(action="DESELECT")
     for clip in channelClips:
@@ -182,15 +688,30 @@ def duplicateChannel(scene, sourceChannelIndex, targetChannelIndex):
     for c in scene.sequence_editor.sequences:
         if c.select:
             c.channel = targetChannelIndex
+    invalidateChannelIndex(scene)
 
 
 def removeChannel(scene, channelIndex):
-    numChannels = 32
-
     clearChannel(scene, channelIndex)
 
-    for ch in range(channelIndex + 1, numChannels + 1):
-        channelClips = getChannelClips(scene, ch)
+    usedChannels = getChannelIndex(scene).get_used_channels()
+    remapChannels(scene, {ch: ch - 1 for ch in usedChannels if channelIndex < ch})
+
+
+def register():
+    utils_handlers.removeAllHandlerOccurences(
+        vt_channelIndex_depsgraph_update_post, handlerCateg=bpy.app.handlers.depsgraph_update_post
+    )
+    bpy.app.handlers.depsgraph_update_post.append(vt_channelIndex_depsgraph_update_post)
+    for handlerCateg in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        utils_handlers.removeAllHandlerOccurences(vt_channelIndex_reset, handlerCateg=handlerCateg)
+        handlerCateg.append(vt_channelIndex_reset)
+
 
-        for clip in channelClips:
-            clip.channel = ch - 1
+def unregister():
+    utils_handlers.removeAllHandlerOccurences(
+        vt_channelIndex_depsgraph_update_post, handlerCateg=bpy.app.handlers.depsgraph_update_post
+    )
+    for handlerCateg in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        utils_handlers.removeAllHandlerOccurences(vt_channelIndex_reset, handlerCateg=handlerCateg)
+    _channelIndices.clear()
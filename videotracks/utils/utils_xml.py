@@ -32,3 +32,74 @@ def getFirstChildWithName(parentNode, name):
     return None
 
 
+def getFcpXmlSideData(xmlFile):
+    """ Read in a single streaming pass the information of a Final Cut xml edit file that are not kept by otio
+        Return a dictionary with:
+            - "videoCharacteristics": dictionary with the "rate", "width" and "height" of the sample characteristics
+              of the video of the first sequence of the file. Keys are missing when values are not found
+            - "xmlClipNames": dictionary with the names of the clip items, by id
+        Parsed elements are removed from the tree as the file is read so that memory stays low
+    """
+    import xml.etree.ElementTree as ET
+
+    videoCharacteristics = dict()
+    sampleCharacteristicsPath = ("media", "video", "format", "samplecharacteristics")
+
+    # clip items, in the order of the file, as [id, name] lists
+    clipItems = list()
+    openClipItems = list()
+
+    tagStack = list()
+    elemStack = list()
+    firstSeqDepth = -1
+    doneWithFirstSequence = False
+
+    for event, elem in ET.iterparse(xmlFile, events=("start", "end")):
+        if "start" == event:
+            tagStack.append(elem.tag)
+            elemStack.append(elem)
+            if "sequence" == elem.tag and -1 == firstSeqDepth:
+                firstSeqDepth = len(tagStack) - 1
+            elif "clipitem" == elem.tag:
+                clipItem = [elem.get("id"), None]
+                clipItems.append(clipItem)
+                openClipItems.append(clipItem)
+            continue
+
+        # end event
+        if "name" == elem.tag:
+            # the name of a clip item is the first name element found in it
+            for clipItem in openClipItems:
+                if clipItem[1] is None:
+                    clipItem[1] = elem.text if elem.text is not None else ""
+        elif "clipitem" == elem.tag:
+            openClipItems.pop()
+
+        if -1 != firstSeqDepth and not doneWithFirstSequence:
+            seqPath = tuple(tagStack[firstSeqDepth + 1 :])
+            if 5 <= len(seqPath) and seqPath[:4] == sampleCharacteristicsPath and elem.text is not None:
+                if ("width",) == seqPath[4:] and "width" not in videoCharacteristics:
+                    videoCharacteristics["width"] = int(elem.text)
+                elif ("height",) == seqPath[4:] and "height" not in videoCharacteristics:
+                    videoCharacteristics["height"] = int(elem.text)
+                elif ("rate", "timebase") == seqPath[4:]:
+                    videoCharacteristics.setdefault("rate", dict()).setdefault("timebase", float(elem.text))
+                elif ("rate", "ntsc") == seqPath[4:]:
+                    videoCharacteristics.setdefault("rate", dict()).setdefault("ntsc", elem.text)
+            elif 0 == len(seqPath):
+                # end of the first sequence
+                doneWithFirstSequence = True
+
+        # the element has been read, it is removed from its parent, which has it as its last child
+        tagStack.pop()
+        elemStack.pop()
+        elem.clear()
+        if len(elemStack):
+            del elemStack[-1][-1]
+
+    xmlClipNames = dict()
+    for clipId, clipName in clipItems:
+        if clipName is not None:
+            xmlClipNames.setdefault(clipId, clipName)
+
+    return {"videoCharacteristics": videoCharacteristics, "xmlClipNames": xmlClipNames}